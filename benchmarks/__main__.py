@@ -0,0 +1,217 @@
+"""
+Benchmark the Hevy coordinator and entities at realistic and extreme sizes.
+
+Run from the repository root with ``scripts/benchmark``, for example
+``scripts/benchmark --sizes 5 500 --exercises 8 --sets 5``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import math
+import tempfile
+import time
+import tracemalloc
+from datetime import timedelta
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.hevy import binary_sensor, sensor
+from custom_components.hevy.const import (
+    CONF_AUTH_TOKEN,
+    CONF_NAME,
+    CONF_USERNAME,
+    DEFAULT_DETAIL_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+)
+from custom_components.hevy.coordinator import (
+    HevyDataUpdateCoordinator,
+    HevyWorkoutCountCoordinator,
+)
+from custom_components.hevy.data import HevyData
+from custom_components.hevy.store import HevyWorkoutStore
+
+from .generator import generate_workouts, workouts_page
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+DEFAULT_SIZES = [5, 500, 5_000, 50_000]
+BINARY_SENSOR_ROUNDS = 1_000
+
+
+class BenchmarkClient:
+    """API client answering from generated workouts."""
+
+    def __init__(self, workouts: list[dict[str, Any]]) -> None:
+        """Initialize the client."""
+        self._workouts = workouts
+
+    async def async_get_workout_count(self) -> dict[str, Any]:
+        """Return the workout count."""
+        return {"workout_count": len(self._workouts)}
+
+    async def async_get_workouts(self, limit: int, offset: int = 0) -> dict[str, Any]:
+        """Return a page of workouts."""
+        return workouts_page(self._workouts, limit, offset)
+
+
+async def _async_create_entry(
+    hass: HomeAssistant, workouts: list[dict[str, Any]]
+) -> ConfigEntry:
+    """Create a config entry whose store already holds every workout."""
+    entry = ConfigEntry(
+        data={
+            CONF_AUTH_TOKEN: "benchmark",
+            CONF_USERNAME: "benchmark",
+            CONF_NAME: "Benchmark",
+        },
+        discovery_keys=MappingProxyType({}),
+        domain=DOMAIN,
+        minor_version=1,
+        options={},
+        pref_disable_polling=True,
+        source="user",
+        title="Benchmark",
+        unique_id=None,
+        version=1,
+    )
+    count_coordinator = HevyWorkoutCountCoordinator(
+        hass=hass,
+        config_entry=entry,
+        name="Benchmark",
+        update_interval=timedelta(minutes=DEFAULT_SCAN_INTERVAL),
+    )
+    store = HevyWorkoutStore(hass, entry.entry_id)
+    store.workouts = {workout["id"]: workout for workout in workouts}
+    store.workout_count = len(workouts)
+    entry.runtime_data = HevyData(
+        client=BenchmarkClient(workouts),
+        coordinator=HevyDataUpdateCoordinator(
+            hass=hass,
+            config_entry=entry,
+            name="Benchmark",
+            update_interval=timedelta(minutes=DEFAULT_DETAIL_INTERVAL),
+            count_coordinator=count_coordinator,
+        ),
+        count_coordinator=count_coordinator,
+        integration=None,
+        store=store,
+    )
+    return entry
+
+
+async def _async_measure(
+    func: Callable[[], Awaitable[Any]], *, trace: bool
+) -> tuple[Any, float]:
+    """Run ``func`` and return its result with its time or peak memory."""
+    if not trace:
+        started = time.perf_counter()
+        result = await func()
+        return result, (time.perf_counter() - started) * 1000
+    tracemalloc.start()
+    try:
+        result = await func()
+        return result, tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+async def _async_run_stages(
+    workouts: list[dict[str, Any]], *, trace: bool
+) -> dict[str, float]:
+    """Run every stage against a fresh Home Assistant instance."""
+    results: dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as config_dir:
+        # Without a recorder the statistics are compared but not imported
+        hass = HomeAssistant(config_dir)
+        await dr.async_load(hass)
+        await er.async_load(hass)
+        entry = await _async_create_entry(hass, workouts)
+        coordinator = entry.runtime_data.coordinator
+
+        # The first update models every workout, later ones only the changed
+        for stage in ("process (cold)", "process (warm)"):
+            coordinator.data, results[stage] = await _async_measure(
+                coordinator._async_update_data,  # noqa: SLF001
+                trace=trace,
+            )
+
+        # The store yields workouts newest first, so the first read sorts the rows
+        async def _async_scan_sets() -> None:
+            """Sum the volume of every set."""
+            columns = coordinator.sets.columns()
+            sum(
+                weight * reps
+                for weight, reps in zip(columns.weight_kg, columns.reps, strict=True)
+                if reps > 0 and not math.isnan(weight)
+            )
+
+        _, results["set table scan"] = await _async_measure(
+            _async_scan_sets, trace=trace
+        )
+
+        sensors: list[Any] = []
+        _, results["sensor setup"] = await _async_measure(
+            lambda: sensor.async_setup_entry(hass, entry, sensors.extend),
+            trace=trace,
+        )
+
+        binary_sensors: list[Any] = []
+        await binary_sensor.async_setup_entry(hass, entry, binary_sensors.extend)
+
+        async def _async_evaluate() -> None:
+            """Evaluate every binary sensor."""
+            for _ in range(BINARY_SENSOR_ROUNDS):
+                for entity in binary_sensors:
+                    entity.is_on  # noqa: B018
+
+        _, results["binary sensors"] = await _async_measure(
+            _async_evaluate, trace=trace
+        )
+        if not trace:
+            results["binary sensors"] /= BINARY_SENSOR_ROUNDS
+
+        await hass.async_stop(force=True)
+    return results
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    """Run the benchmarks and print a report."""
+    print(  # noqa: T201
+        f"{'workouts':>9}  {'stage':<15}  {'time (ms)':>10}  {'peak (MiB)':>10}"
+    )
+    for size in args.sizes:
+        workouts = generate_workouts(
+            size,
+            exercises=args.exercises,
+            sets=args.sets,
+            null_ratio=args.null_ratio,
+        )
+        timings = await _async_run_stages(workouts, trace=False)
+        peaks = await _async_run_stages(workouts, trace=True)
+        for stage, elapsed in timings.items():
+            print(  # noqa: T201
+                f"{size:>9}  {stage:<15}  {elapsed:>10.3f}  {peaks[stage]:>10.2f}"
+            )
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmarks."""
+    parser = argparse.ArgumentParser(description="Benchmark the Hevy integration.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--exercises", type=int, default=6)
+    parser.add_argument("--sets", type=int, default=4)
+    parser.add_argument("--null-ratio", type=float, default=0.1)
+    asyncio.run(_async_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
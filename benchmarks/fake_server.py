@@ -0,0 +1,182 @@
+"""
+Local stand-in for the Hevy API with latency and fault injection.
+
+Serves ``/workout_count`` and ``/user_workouts_paged`` from generated
+workouts, for example::
+
+    python3 -m benchmarks.fake_server --workouts 5000 --latency 0.2 \
+        --error-rate 0.05 --rate-limit-rate 0.05
+
+Point the integration at it with the API URL of the advanced config flow, or
+pass ``base_url`` to ``HevyApiClient``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+from aiohttp import web
+
+from .generator import generate_workouts, workouts_page
+
+DEFAULT_PORT = 8765
+
+
+@dataclass
+class Faults:
+    """Latency and failures injected into every response."""
+
+    latency: float = 0.0  # seconds
+    jitter: float = 0.0  # seconds
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after: float = 1.0  # seconds
+    slow_body: float = 0.0  # seconds to send each body over
+    chunk_size: int = 4096
+
+
+class FakeHevyApi:
+    """aiohttp application answering like the Hevy API."""
+
+    def __init__(
+        self,
+        workouts: list[dict[str, Any]],
+        faults: Faults | None = None,
+        seed: int = 0,
+    ) -> None:
+        """Initialize the fake API with workouts ordered newest first."""
+        self.workouts = workouts
+        self.faults = faults or Faults()
+        # Responses sent per path and status, to measure client behaviour
+        self.stats: Counter[tuple[str, int]] = Counter()
+        self._rng = random.Random(seed)  # noqa: S311
+        self._runner: web.AppRunner | None = None
+        self.app = web.Application()
+        self.app.router.add_get("/workout_count", self._handle_workout_count)
+        self.app.router.add_get("/user_workouts_paged", self._handle_workouts)
+
+    def add_workouts(self, workouts: list[dict[str, Any]]) -> None:
+        """Add workouts newer than every existing one."""
+        self.workouts = workouts + self.workouts
+
+    async def async_start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving in the running event loop and return the base URL."""
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        host, port = self._runner.addresses[0][:2]
+        return f"http://{host}:{port}"
+
+    async def async_stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle_workout_count(self, request: web.Request) -> web.StreamResponse:
+        """Answer a workout count request."""
+        return await self._async_respond(request, {"workout_count": len(self.workouts)})
+
+    async def _handle_workouts(self, request: web.Request) -> web.StreamResponse:
+        """Answer a page of workouts, newest first."""
+        try:
+            limit = int(request.query.get("limit", 5))
+            offset = int(request.query.get("offset", 0))
+        except ValueError:
+            return self._record(request, web.Response(status=400))
+        return await self._async_respond(
+            request, workouts_page(self.workouts, limit, offset)
+        )
+
+    async def _async_respond(
+        self, request: web.Request, payload: dict[str, Any]
+    ) -> web.StreamResponse:
+        """Send a payload after applying the configured faults."""
+        faults = self.faults
+        await asyncio.sleep(
+            max(faults.latency + self._rng.uniform(-faults.jitter, faults.jitter), 0)
+        )
+        if "auth-token" not in request.headers:
+            return self._record(request, web.Response(status=401))
+        roll = self._rng.random()
+        if roll < faults.rate_limit_rate:
+            return self._record(
+                request,
+                web.Response(
+                    status=429, headers={"Retry-After": f"{faults.retry_after:g}"}
+                ),
+            )
+        if roll < faults.rate_limit_rate + faults.error_rate:
+            return self._record(request, web.Response(status=500))
+
+        body = json.dumps(payload).encode()
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        if request.headers.get("If-None-Match") == etag:
+            return self._record(request, web.Response(status=304))
+        if not faults.slow_body:
+            return self._record(
+                request,
+                web.Response(
+                    body=body, content_type="application/json", headers={"ETag": etag}
+                ),
+            )
+
+        # Trickle the body out in chunks over the configured time
+        response = web.StreamResponse(headers={"ETag": etag})
+        response.content_type = "application/json"
+        response.content_length = len(body)
+        await response.prepare(request)
+        offsets = range(0, len(body), faults.chunk_size)
+        for offset in offsets:
+            await response.write(body[offset : offset + faults.chunk_size])
+            await asyncio.sleep(faults.slow_body / len(offsets))
+        await response.write_eof()
+        return self._record(request, response)
+
+    def _record(
+        self, request: web.Request, response: web.StreamResponse
+    ) -> web.StreamResponse:
+        """Count a response in the stats."""
+        self.stats[request.path, response.status] += 1
+        return response
+
+
+def main() -> None:
+    """Parse the arguments and serve the fake API until interrupted."""
+    parser = argparse.ArgumentParser(description="Serve a fake Hevy API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workouts", type=int, default=500)
+    parser.add_argument("--exercises", type=int, default=6)
+    parser.add_argument("--sets", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--slow-body", type=float, default=0.0)
+    args = parser.parse_args()
+
+    api = FakeHevyApi(
+        generate_workouts(args.workouts, exercises=args.exercises, sets=args.sets),
+        Faults(
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            rate_limit_rate=args.rate_limit_rate,
+            retry_after=args.retry_after,
+            slow_body=args.slow_body,
+        ),
+    )
+    web.run_app(api.app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Synthetic Hevy-shaped workout data."""
+
+from __future__ import annotations
+
+import random
+import time
+import uuid
+from typing import Any
+
+EXERCISE_TITLES = [
+    "Bench Press (Barbell)",
+    "Squat (Barbell)",
+    "Deadlift (Barbell)",
+    "Overhead Press (Barbell)",
+    "Pull Up",
+    "Bent Over Row (Barbell)",
+    "Lat Pulldown (Cable)",
+    "Leg Press",
+    "Bicep Curl (Dumbbell)",
+    "Triceps Pushdown",
+    "Lateral Raise (Dumbbell)",
+    "Romanian Deadlift (Barbell)",
+    "Incline Bench Press (Dumbbell)",
+    "Leg Curl (Machine)",
+    "Plank",
+    "Running",
+]
+
+WORKOUT_TITLES = ["Push", "Pull", "Legs", "Upper", "Lower", "Full Body", "Cardio"]
+
+# Keep generated histories within about ten years however many workouts
+MAX_HISTORY_SECONDS = 10 * 365 * 24 * 60 * 60
+MAX_WORKOUT_GAP = 36 * 60 * 60
+
+
+def generate_workouts(  # noqa: PLR0913
+    count: int,
+    *,
+    exercises: int = 6,
+    sets: int = 4,
+    null_ratio: float = 0.1,
+    seed: int = 0,
+    newest: float | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Generate workouts like the ones in a ``user_workouts_paged`` page.
+
+    Workouts are returned newest first, like the API pages them.
+
+    Args:
+        count: The number of workouts.
+        exercises: The number of exercises per workout.
+        sets: The number of sets per exercise.
+        null_ratio: The share of sets without ``reps`` and of sets without
+            ``weight_kg``.
+        seed: The seed making the data reproducible.
+        newest: The start time of the newest workout, defaults to now.
+
+    """
+    rng = random.Random(seed)  # noqa: S311
+    templates = [
+        (uuid.UUID(int=rng.getrandbits(128)).hex[:8].upper(), title)
+        for title in EXERCISE_TITLES
+    ]
+    gap = min(MAX_WORKOUT_GAP, MAX_HISTORY_SECONDS / max(count, 1))
+    start_time = time.time() if newest is None else newest
+
+    workouts = []
+    for _ in range(count):
+        workout_exercises = []
+        for _ in range(exercises):
+            template_id, title = rng.choice(templates)
+            workout_exercises.append(
+                {
+                    "id": str(uuid.UUID(int=rng.getrandbits(128))),
+                    "title": title,
+                    "exercise_template_id": template_id,
+                    "superset_id": None,
+                    "notes": "",
+                    "sets": [
+                        _generate_set(rng, index, null_ratio) for index in range(sets)
+                    ],
+                }
+            )
+        duration = rng.randint(30, 120) * 60
+        workouts.append(
+            {
+                "id": str(uuid.UUID(int=rng.getrandbits(128))),
+                "name": rng.choice(WORKOUT_TITLES),
+                "description": "",
+                "start_time": int(start_time),
+                "end_time": int(start_time) + duration,
+                "estimated_volume_kg": round(
+                    sum(
+                        (set_data["weight_kg"] or 0) * (set_data["reps"] or 0)
+                        for exercise in workout_exercises
+                        for set_data in exercise["sets"]
+                    ),
+                    1,
+                ),
+                "exercises": workout_exercises,
+            }
+        )
+        start_time -= rng.uniform(0.5, 1.5) * gap
+    return workouts
+
+
+def _generate_set(rng: random.Random, index: int, null_ratio: float) -> dict[str, Any]:
+    """Generate a set of an exercise."""
+    return {
+        "index": index,
+        "indicator": "warmup" if index == 0 else "normal",
+        "weight_kg": (
+            None
+            if rng.random() < null_ratio
+            else round(rng.uniform(5, 200) / 2.5) * 2.5
+        ),
+        "reps": None if rng.random() < null_ratio else rng.randint(1, 15),
+        "rpe": None,
+        "duration_seconds": None,
+        "distance_meters": None,
+    }
+
+
+def workouts_page(
+    workouts: list[dict[str, Any]], limit: int, offset: int
+) -> dict[str, Any]:
+    """Return a ``user_workouts_paged`` response for a slice of the workouts."""
+    return {"workouts": workouts[offset : offset + limit]}
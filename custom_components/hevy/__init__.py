@@ -1,16 +1,32 @@
+import asyncio
 from datetime import timedelta
 from typing import TYPE_CHECKING
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_time_change
 from homeassistant.loader import async_get_integration
 
 from .api import HevyApiClient
-from .const import CONF_AUTH_TOKEN, CONF_USERNAME, CONF_NAME, CONF_X_API_KEY, DEFAULT_X_API_KEY, DEFAULT_SCAN_INTERVAL
-from .coordinator import HevyDataUpdateCoordinator
+from .const import (
+    BASE_URL,
+    CONF_AUTH_TOKEN,
+    CONF_BASE_URL,
+    CONF_NAME,
+    CONF_USERNAME,
+    CONF_X_API_KEY,
+    DEFAULT_DETAIL_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_X_API_KEY,
+    DOMAIN,
+)
+from .coordinator import HevyDataUpdateCoordinator, HevyWorkoutCountCoordinator
 from .data import HevyData
+from .services import async_setup_services
+from .store import HevyWorkoutStore
 
 if TYPE_CHECKING:
     from .data import HevyConfigEntry
@@ -23,6 +39,17 @@ PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(
+    hass: HomeAssistant,
+    config: dict,  # noqa: ARG001 Unused function argument: `config`
+) -> bool:
+    """Set up the services, which outlive the config entries."""
+    async_setup_services(hass)
+    return True
+
 
 # https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
 async def async_setup_entry(
@@ -30,40 +57,106 @@ async def async_setup_entry(
     entry: HevyConfigEntry,
 ) -> bool:
     """Set up this integration using UI."""
-    coordinator = HevyDataUpdateCoordinator(
+    # A cheap probe polls the workout count and triggers the detail coordinator
+    count_coordinator = HevyWorkoutCountCoordinator(
         hass=hass,
+        config_entry=entry,
         name=entry.data[CONF_NAME],
         update_interval=timedelta(minutes=DEFAULT_SCAN_INTERVAL),
     )
+    coordinator = HevyDataUpdateCoordinator(
+        hass=hass,
+        config_entry=entry,
+        name=entry.data[CONF_NAME],
+        update_interval=timedelta(minutes=DEFAULT_DETAIL_INTERVAL),
+        count_coordinator=count_coordinator,
+    )
     # Use provided x_api_key or default if not present
     x_api_key = entry.data.get(CONF_X_API_KEY, DEFAULT_X_API_KEY)
-    
+    store = HevyWorkoutStore(hass, entry.entry_id)
+    await store.async_load()
+
     entry.runtime_data = HevyData(
         client=HevyApiClient(
             auth_token=entry.data[CONF_AUTH_TOKEN],
             username=entry.data[CONF_USERNAME],
             session=async_get_clientsession(hass),
             x_api_key=x_api_key,
+            base_url=entry.data.get(CONF_BASE_URL, BASE_URL),
         ),
         integration=await async_get_integration(hass, entry.domain),
         coordinator=coordinator,
+        count_coordinator=count_coordinator,
+        store=store,
     )
 
-    # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
-    await coordinator.async_config_entry_first_refresh()
+    if store.workout_count is not None:
+        # Come up with the stored workouts and refresh in the background
+        count_coordinator.async_restore(
+            {"workout_count": store.workout_count}, store.fetched_at
+        )
+        await coordinator.async_restore_store()
+        entry.async_create_background_task(
+            hass,
+            _async_refresh_restored(entry),
+            name=f"{entry.domain} refresh {coordinator.name}",
+        )
+    else:
+        # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
+        # Concurrent workout count requests of both tiers are coalesced by the client
+        await asyncio.gather(
+            count_coordinator.async_config_entry_first_refresh(),
+            coordinator.async_config_entry_first_refresh(),
+        )
+        _async_follow_probe(entry)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    entry.async_on_unload(
+        async_track_time_change(
+            hass, coordinator.async_handle_midnight, hour=0, minute=0, second=0
+        )
+    )
 
     return True
 
 
+async def _async_refresh_restored(entry: HevyConfigEntry) -> None:
+    """Replace restored data with fresh data from the API."""
+    # Probe first, so the details are fetched against the current workout count
+    await entry.runtime_data.count_coordinator.async_refresh()
+    await entry.runtime_data.coordinator.async_refresh()
+    _async_follow_probe(entry)
+
+
+@callback
+def _async_follow_probe(entry: HevyConfigEntry) -> None:
+    """Refresh the details whenever the probe sees a new workout count."""
+    coordinator = entry.runtime_data.coordinator
+    entry.async_on_unload(
+        entry.runtime_data.count_coordinator.async_add_listener(
+            coordinator.async_handle_count_update
+        )
+    )
+
+
 async def async_unload_entry(
     hass: HomeAssistant,
     entry: HevyConfigEntry,
 ) -> bool:
     """Handle removal of an entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        await entry.runtime_data.store.async_save()
+    return unload_ok
+
+
+async def async_remove_entry(
+    hass: HomeAssistant,
+    entry: HevyConfigEntry,
+) -> None:
+    """Remove stored data when the entry is deleted."""
+    await HevyWorkoutStore(hass, entry.entry_id).async_remove()
 
 
 async def async_reload_entry(
@@ -71,5 +164,4 @@ async def async_reload_entry(
     entry: HevyConfigEntry,
 ) -> None:
     """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    await hass.config_entries.async_reload(entry.entry_id)
@@ -0,0 +1,49 @@
+"""Workout activity index for hevy."""
+
+from __future__ import annotations
+
+from collections import Counter
+from datetime import date, datetime, timedelta
+
+from homeassistant.util import dt as dt_util
+
+
+class ActivityIndex:
+    """Workout counts bucketed by local calendar day, month and year."""
+
+    def __init__(self) -> None:
+        """Initialize the activity index."""
+        self._workout_days: dict[str, date] = {}
+        self._days: Counter[date] = Counter()
+        self._months: Counter[tuple[int, int]] = Counter()
+        self._years: Counter[int] = Counter()
+
+    def add(self, workout_id: str, start_time: datetime) -> None:
+        """Add a workout, replacing it if it was indexed before."""
+        self.remove(workout_id)
+        day = dt_util.as_local(start_time).date()
+        self._workout_days[workout_id] = day
+        self._days[day] += 1
+        self._months[day.year, day.month] += 1
+        self._years[day.year] += 1
+
+    def remove(self, workout_id: str) -> None:
+        """Remove a workout from the index."""
+        if (day := self._workout_days.pop(workout_id, None)) is None:
+            return
+        self._days[day] -= 1
+        self._months[day.year, day.month] -= 1
+        self._years[day.year] -= 1
+
+    def count_since(self, today: date, days: int) -> int:
+        """Return the number of workouts in the last ``days`` days up to today."""
+        return sum(self._days[today - timedelta(days=offset)] for offset in range(days))
+
+    def counts(self, today: date) -> dict[str, int]:
+        """Return the period counts relative to ``today``."""
+        return {
+            "today_count": self._days[today],
+            "week_count": self.count_since(today, 7),
+            "month_count": self._months[today.year, today.month],
+            "year_count": self._years[today.year],
+        }
@@ -0,0 +1,184 @@
+"""Training analytics over the whole set history for hevy."""
+
+from __future__ import annotations
+
+from itertools import pairwise
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CHRONIC_LOAD_DAYS,
+    E1RM_MAX_REPS,
+    INTENSITY_BUCKETS,
+    MAX_EXERCISE_TRENDS,
+    TREND_WEEKS,
+)
+
+if TYPE_CHECKING:
+    from array import array
+    from datetime import datetime
+
+    from .set_table import SetColumns
+
+_DAY = 24 * 60 * 60  # seconds
+_WEEK = 7 * _DAY
+
+
+def as_numpy(column: array) -> np.ndarray:
+    """Return a read-only view of a column without copying it."""
+    if not column:
+        return np.empty(0, dtype=column.typecode)
+    return np.frombuffer(column, dtype=column.typecode)
+
+
+def training_analytics(
+    columns: SetColumns, exercise_titles: list[str], now: datetime
+) -> dict[str, Any]:
+    """
+    Return the monthly tonnage, intensity and volume trends as of ``now``.
+
+    Every figure is computed with vectorized passes over the set columns,
+    which are ordered by start time, so windows are binary searches into a
+    running sum of the volume.
+    """
+    times = as_numpy(columns.start_time)
+    exercises = as_numpy(columns.exercise)
+    weights = as_numpy(columns.weight_kg)
+    reps = as_numpy(columns.reps)
+
+    # NaN weights compare false, so sets without a weight are left out
+    lifted = (reps > 0) & (weights > 0)
+    volume = np.where(lifted, weights * reps, 0.0)
+    running = np.concatenate(([0.0], np.cumsum(volume)))
+    timestamp = now.timestamp()
+
+    def _since(start: float) -> float:
+        """Return the volume lifted from ``start`` on."""
+        return float(running[-1] - running[np.searchsorted(times, start)])
+
+    month_start = dt_util.start_of_local_day(
+        dt_util.as_local(now).date().replace(day=1)
+    )
+
+    return {
+        "month_tonnage": round(_since(month_start.timestamp()), 1),
+        **_intensity(
+            times[lifted],
+            exercises[lifted],
+            weights[lifted],
+            reps[lifted],
+            len(exercise_titles),
+            timestamp - CHRONIC_LOAD_DAYS * _DAY,
+        ),
+        **_trends(times, exercises, volume, exercise_titles, timestamp),
+    }
+
+
+def _intensity(  # noqa: PLR0913
+    times: np.ndarray,
+    exercises: np.ndarray,
+    weights: np.ndarray,
+    reps: np.ndarray,
+    exercise_count: int,
+    start: float,
+) -> dict[str, Any]:
+    """Return how heavy the recent sets were relative to each estimated 1RM."""
+    # Best Epley estimate of every exercise over the whole history
+    estimable = reps <= E1RM_MAX_REPS
+    estimates = np.where(reps == 1, weights, weights * (1 + reps / 30))
+    best = np.zeros(exercise_count)
+    np.maximum.at(best, exercises[estimable], estimates[estimable])
+
+    recent = slice(np.searchsorted(times, start), None)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Exercises only done for many reps have no estimate to compare with
+        intensity = weights[recent] / best[exercises[recent]] * 100
+    intensity = intensity[np.isfinite(intensity)]
+    if not intensity.size:
+        return {"training_intensity": None, "intensity_distribution": {}}
+
+    counts = np.bincount(
+        np.searchsorted(INTENSITY_BUCKETS, intensity, side="right"),
+        minlength=len(INTENSITY_BUCKETS) + 1,
+    )
+    labels = [f"<{INTENSITY_BUCKETS[0]}%"]
+    labels.extend(f"{low}-{high}%" for low, high in pairwise(INTENSITY_BUCKETS))
+    labels.append(f">={INTENSITY_BUCKETS[-1]}%")
+    return {
+        "training_intensity": round(float(intensity.mean()), 1),
+        "intensity_distribution": {
+            label: round(float(count) / intensity.size * 100, 1)
+            for label, count in zip(labels, counts, strict=True)
+        },
+    }
+
+
+def _trends(
+    times: np.ndarray,
+    exercises: np.ndarray,
+    volume: np.ndarray,
+    exercise_titles: list[str],
+    timestamp: float,
+) -> dict[str, Any]:
+    """Return the weekly volume trends, in percent of the mean week per week."""
+    edges = timestamp - _WEEK * np.arange(TREND_WEEKS, -1, -1)
+    start = np.searchsorted(times, edges[0])
+    # Sets timestamped after now count towards the last week
+    weeks = np.minimum(
+        np.searchsorted(edges, times[start:], side="right") - 1, TREND_WEEKS - 1
+    )
+    exercises = exercises[start:]
+    volume = volume[start:]
+
+    # Weekly volume per exercise, one row per exercise
+    weekly = np.bincount(
+        exercises.astype(np.intp) * TREND_WEEKS + weeks,
+        weights=volume,
+        minlength=len(exercise_titles) * TREND_WEEKS,
+    ).reshape(len(exercise_titles), TREND_WEEKS)
+    centered = np.arange(TREND_WEEKS) - (TREND_WEEKS - 1) / 2
+    scale = centered @ centered
+
+    total = weekly.sum(axis=0)
+    total_mean = total.mean() if total.size else 0.0
+    volume_trend = (
+        round(float(total @ centered / scale / total_mean * 100), 1)
+        if total_mean
+        else None
+    )
+
+    # Only exercises trained in at least two of the weeks have a trend
+    trained = np.flatnonzero(np.count_nonzero(weekly, axis=1) >= 2)
+    slopes = weekly[trained] @ centered / scale / weekly[trained].mean(axis=1) * 100
+    strongest = trained[np.argsort(-np.abs(slopes))][:MAX_EXERCISE_TRENDS]
+    by_exercise = dict(zip(trained.tolist(), slopes.tolist(), strict=True))
+    return {
+        "volume_trend": volume_trend,
+        "exercise_trends": {
+            exercise_titles[exercise]: round(by_exercise[exercise], 1)
+            for exercise in strongest.tolist()
+        },
+    }
+
+
+def weekly_volume(
+    columns: SetColumns, workout_times: array[float], edges: list[float]
+) -> list[tuple[float, int, int]]:
+    """Return the volume, sets and workouts between each pair of week edges."""
+    times = as_numpy(columns.start_time)
+    weights = as_numpy(columns.weight_kg)
+    reps = as_numpy(columns.reps)
+    volume = np.where((reps > 0) & (weights > 0), weights * reps, 0.0)
+    running = np.concatenate(([0.0], np.cumsum(volume)))
+    rows = np.searchsorted(times, edges)
+    workouts = np.searchsorted(as_numpy(workout_times), edges)
+    return list(
+        zip(
+            np.round(np.diff(running[rows]), 1).tolist(),
+            np.diff(rows).tolist(),
+            np.diff(workouts).tolist(),
+            strict=True,
+        )
+    )
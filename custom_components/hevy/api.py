@@ -2,13 +2,44 @@
 
 from __future__ import annotations
 
+import asyncio
+import random
+import re
 import socket
-from typing import Any
+import time
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
 import async_timeout
+from homeassistant.util.json import json_loads
 
-from .const import BASE_URL, DEFAULT_WORKOUTS_COUNT
+from .const import (
+    BASE_URL,
+    CACHE_MAX_AGE,
+    CACHE_MAX_BYTES,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_MAX_RESET_TIMEOUT,
+    CIRCUIT_RESET_TIMEOUT,
+    DEFAULT_WORKOUTS_COUNT,
+    LOGGER,
+    REQUEST_BURST,
+    REQUEST_RATE,
+    REQUEST_TIMEOUT,
+    RETRY_AFTER_MAX,
+    RETRY_ATTEMPTS,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+)
+from .metrics import ClientMetrics, elapsed_ms
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
 
 
 class HevyApiClientError(Exception):
@@ -27,6 +58,18 @@ class HevyApiClientAuthenticationError(
     """Exception to indicate an authentication error."""
 
 
+class HevyApiClientRateLimitError(
+    HevyApiClientCommunicationError,
+):
+    """Exception to indicate the API rate limited the request."""
+
+
+class HevyApiClientCircuitOpenError(
+    HevyApiClientCommunicationError,
+):
+    """Exception to indicate requests are held back while the API is failing."""
+
+
 def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
     """Verify that the response is valid."""
     if response.status in (401, 403):
@@ -37,15 +80,289 @@ def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
     response.raise_for_status()
 
 
+def _parse_retry_after(value: str | None) -> float | None:
+    """Return the delay in seconds requested by a Retry-After header."""
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        # A -0000 zone parses naive, it still means UTC
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max((retry_at - datetime.now(UTC)).total_seconds(), 0.0)
+
+
+class _TokenBucket:
+    """Token bucket limiting how fast requests are sent."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Initialize the token bucket."""
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every request for ``seconds``, e.g. after a 429."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    async def async_acquire(self) -> None:
+        """Wait until a request may be sent."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+class _CircuitBreaker:
+    """
+    Circuit breaker that stops sending requests while the API keeps failing.
+
+    After ``threshold`` consecutive failures the circuit opens and requests
+    fail fast. Once ``reset_timeout`` passed it is half-open and lets a single
+    probe request through: success closes the circuit, failure opens it again
+    for twice as long, up to ``max_reset_timeout``.
+    """
+
+    def __init__(
+        self, threshold: int, reset_timeout: float, max_reset_timeout: float
+    ) -> None:
+        """Initialize the circuit breaker."""
+        self._threshold = threshold
+        self._reset_timeout = reset_timeout
+        self._max_reset_timeout = max_reset_timeout
+        self._timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        """Return closed, open or half_open."""
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at < self._timeout:
+            return "open"
+        return "half_open"
+
+    def before_request(self) -> None:
+        """Raise unless a request may be sent now."""
+        state = self.state
+        if state == "closed":
+            return
+        if state == "open" or self._probing:
+            msg = f"Hevy API is failing, holding back requests ({state})"
+            raise HevyApiClientCircuitOpenError(msg)
+        self._probing = True
+
+    def record_success(self) -> None:
+        """Close the circuit after the API answered."""
+        if self._opened_at is not None:
+            LOGGER.info("Hevy API is reachable again, closing the circuit")
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+        self._timeout = self._reset_timeout
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the circuit when there are too many."""
+        if self._probing:
+            self._probing = False
+            self._timeout = min(self._timeout * 2, self._max_reset_timeout)
+            self._opened_at = time.monotonic()
+            return
+        self._failures += 1
+        if self._failures >= self._threshold and self._opened_at is None:
+            LOGGER.warning(
+                "Hevy API failed %s times in a row, holding back requests for %ss",
+                self._failures,
+                self._timeout,
+            )
+            self._opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """Free the probe slot of a request that did not complete."""
+        self._probing = False
+
+
+# A complete or unterminated string, or a bracket outside of strings
+_JSON_TOKEN = re.compile(rb'"(?:[^"\\]|\\.)*("?)|[{}\[\]]', re.DOTALL)
+
+
+class _JsonItemStream:
+    """Split the objects of a top-level array field out of a streamed JSON body."""
+
+    def __init__(self, key: str) -> None:
+        """Initialize the stream for the array stored under ``key``."""
+        self._key = f'"{key}"'.encode()
+        self._buffer = b""
+        self._position = 0
+        self._depth = 0
+        self._last_key = b""
+        self._in_array = False
+        self._item_start: int | None = None
+        self._started = False
+
+    @property
+    def complete(self) -> bool:
+        """Return whether the whole JSON document was read."""
+        return self._started and self._depth == 0
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Add a chunk of the body and return the items it completed."""
+        buffer = self._buffer + chunk
+        position = self._position
+        items = []
+        while (match := _JSON_TOKEN.search(buffer, position)) is not None:
+            token = match.group()
+            if token[:1] == b'"':
+                if not match.group(1):
+                    # The string continues in the next chunk
+                    break
+                if self._depth == 1:
+                    self._last_key = token
+            elif token in (b"{", b"["):
+                self._started = True
+                if self._in_array and self._depth == 2 and token == b"{":
+                    self._item_start = match.start()
+                elif self._depth == 1 and token == b"[":
+                    self._in_array = self._last_key == self._key
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._item_start is not None and self._depth == 2:
+                    items.append(buffer[self._item_start : match.end()])
+                    self._item_start = None
+                elif self._depth == 1:
+                    self._in_array = False
+            position = match.end()
+
+        # Only keep the item being read and what was not scanned yet
+        keep = position if self._item_start is None else self._item_start
+        self._buffer = buffer[keep:]
+        self._position = position - keep
+        if self._item_start is not None:
+            self._item_start = 0
+        return items
+
+
+def _request_key(method: str, url: str, params: dict | None) -> tuple:
+    """Return a hashable key identifying a request."""
+    return (method, url, tuple(sorted((params or {}).items())))
+
+
+# In-flight requests per session, shared by every client using that session
+_IN_FLIGHT: weakref.WeakKeyDictionary[
+    aiohttp.ClientSession, dict[tuple, asyncio.Task]
+] = weakref.WeakKeyDictionary()
+
+
+@dataclass(slots=True)
+class _CachedResponse:
+    """Decoded response body together with its HTTP validators."""
+
+    etag: str | None
+    last_modified: str | None
+    body: Any
+    size: int
+    stored_at: float
+
+
+class _ResponseCache:
+    """Conditional-request cache keyed by method, URL and parameters."""
+
+    def __init__(self, max_bytes: int, max_age: float) -> None:
+        """Initialize the response cache."""
+        self._max_bytes = max_bytes
+        self._max_age = max_age
+        self._entries: OrderedDict[tuple, _CachedResponse] = OrderedDict()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple) -> _CachedResponse | None:
+        """Return the cached response for a key unless it is too old."""
+        if (entry := self._entries.get(key)) is None:
+            return None
+        if time.monotonic() - entry.stored_at > self._max_age:
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: tuple, headers: Any, body: Any, size: int) -> None:
+        """Cache a response if the server sent validators for it."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if key in self._entries:
+            self._remove(key)
+        if (etag is None and last_modified is None) or size > self._max_bytes:
+            return
+        self._entries[key] = _CachedResponse(
+            etag, last_modified, body, size, time.monotonic()
+        )
+        self._size += size
+        # Evict least recently used responses beyond the size budget
+        while self._size > self._max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: tuple) -> None:
+        """Drop a cached response."""
+        self._size -= self._entries.pop(key).size
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return cache counters."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "bytes": self._size,
+        }
+
+
+def _conditional_headers(entry: _CachedResponse | None) -> dict[str, str]:
+    """Return the validator headers for a cached response."""
+    if entry is None:
+        return {}
+    headers = {}
+    if entry.etag is not None:
+        headers["If-None-Match"] = entry.etag
+    if entry.last_modified is not None:
+        headers["If-Modified-Since"] = entry.last_modified
+    return headers
+
+
 class HevyApiClient:
     """Hevy API Client."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         auth_token: str,
         username: str,
         session: aiohttp.ClientSession,
         x_api_key: str = "shelobs_hevy_web",
+        timeout: float = REQUEST_TIMEOUT,
+        max_retries: int = RETRY_ATTEMPTS,
+        base_url: str = BASE_URL,
     ) -> None:
         """Initialize Hevy API Client.
         
@@ -54,10 +371,22 @@ class HevyApiClient:
             username: The Hevy username.
             session: The aiohttp ClientSession.
             x_api_key: The x-api-key value to use for API requests.
+            timeout: The timeout in seconds for a single request attempt.
+            max_retries: How often a transient failure is retried.
+            base_url: The API to talk to, e.g. a local stand-in for testing.
         """
         self._auth_token = auth_token
         self._username = username
         self._session = session
+        self._base_url = base_url
+        self._timeout = timeout
+        self._max_retries = max_retries
+        self._throttle = _TokenBucket(REQUEST_RATE, REQUEST_BURST)
+        self._cache = _ResponseCache(CACHE_MAX_BYTES, CACHE_MAX_AGE)
+        self._breaker = _CircuitBreaker(
+            CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT, CIRCUIT_MAX_RESET_TIMEOUT
+        )
+        self.metrics = ClientMetrics()
         self._headers = {
             "Accept": "application/json, text/plain, */*",
             "Hevy-Platform": "web",
@@ -65,6 +394,33 @@ class HevyApiClient:
             "x-api-key": x_api_key,
         }
 
+    @property
+    def cache_stats(self) -> dict[str, int]:
+        """Return hit and miss counters of the response cache."""
+        return self._cache.stats
+
+    @property
+    def circuit_state(self) -> str:
+        """Return the state of the circuit breaker."""
+        return self._breaker.state
+
+    @property
+    def cache_hit_rate(self) -> float | None:
+        """Return the share of cacheable requests answered from the cache."""
+        stats = self._cache.stats
+        if not (requests := stats["hits"] + stats["misses"]):
+            return None
+        return round(stats["hits"] / requests * 100, 1)
+
+    @property
+    def diagnostics(self) -> dict[str, Any]:
+        """Return the request metrics, cache and circuit breaker state."""
+        return {
+            "endpoints": self.metrics.as_dict(),
+            "cache": {**self._cache.stats, "hit_rate": self.cache_hit_rate},
+            "circuit": self.circuit_state,
+        }
+
     async def async_get_workout_count(self) -> dict[str, Any]:
         """Get workout count.
 
@@ -73,7 +429,7 @@ class HevyApiClient:
         """
         return await self._api_wrapper(
             method="get",
-            url=f"{BASE_URL}/workout_count",
+            url=f"{self._base_url}/workout_count",
             params={},
         )
 
@@ -91,10 +447,28 @@ class HevyApiClient:
         """
         return await self._api_wrapper(
             method="get",
-            url=f"{BASE_URL}/user_workouts_paged",
+            url=f"{self._base_url}/user_workouts_paged",
             params={"username": self._username, "limit": limit, "offset": offset},
         )
 
+    async def async_iter_workouts(
+        self, limit: int = DEFAULT_WORKOUTS_COUNT, offset: int = 0
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream a page of workouts, decoding one workout at a time.
+
+        Unlike ``async_get_workouts`` the page is neither cached nor shared
+        with concurrent callers, so memory is bounded by a single workout
+        rather than the whole page.
+        """
+        with self._circuit():
+            async for workout in self._async_stream(
+                f"{self._base_url}/user_workouts_paged",
+                {"username": self._username, "limit": limit, "offset": offset},
+                "workouts",
+            ):
+                yield workout
+
     async def _api_wrapper(
         self,
         method: str,
@@ -102,31 +476,248 @@ class HevyApiClient:
         params: dict | None = None,
         data: dict | None = None,
     ) -> Any:
-        """Get information from the API."""
+        """
+        Get information from the API, sharing identical in-flight requests.
+
+        Concurrent calls with the same method, URL, params and credentials on
+        the same session await a single request and its decoded result.
+        """
+        if data is not None:
+            return await self._async_request(method, url, params, data)
+
+        key = (
+            *_request_key(method, url, params),
+            self._headers["auth-token"],
+            self._headers["x-api-key"],
+        )
+        in_flight = _IN_FLIGHT.setdefault(self._session, {})
+        if (task := in_flight.get(key)) is None:
+            task = asyncio.get_running_loop().create_task(
+                self._async_request(method, url, params, data)
+            )
+            in_flight[key] = task
+            task.add_done_callback(lambda done: _forget_request(in_flight, key, done))
+        # Shield the shared request so one cancelled caller does not cancel it
+        return await asyncio.shield(task)
+
+    async def _async_request(
+        self,
+        method: str,
+        url: str,
+        params: dict | None,
+        data: dict | None,
+    ) -> Any:
+        """
+        Send a request through the circuit breaker.
+
+        Only transport errors, server errors and rate limiting count as
+        failures; any other answer shows the API is reachable.
+        """
+        with self._circuit():
+            return await self._async_send(method, url, params, data)
+
+    @contextmanager
+    def _circuit(self) -> Iterator[None]:
+        """Guard a request with the circuit breaker."""
+        self._breaker.before_request()
         try:
-            async with async_timeout.timeout(10):
-                response = await self._session.request(
-                    method=method,
-                    url=url,
-                    headers=self._headers,
-                    params=params,
-                    json=data,
+            yield
+        except HevyApiClientCommunicationError as exception:
+            if _is_outage(exception.__cause__):
+                self._breaker.record_failure()
+            else:
+                self._breaker.record_success()
+            raise
+        except HevyApiClientError:
+            self._breaker.record_success()
+            raise
+        except BaseException:
+            self._breaker.release()
+            raise
+        self._breaker.record_success()
+
+    async def _async_send(
+        self,
+        method: str,
+        url: str,
+        params: dict | None,
+        data: dict | None,
+    ) -> Any:
+        """
+        Send a request, retrying transient failures.
+
+        GET responses carrying an ETag or Last-Modified header are cached and
+        revalidated, so an unchanged resource is answered by a 304 without
+        downloading or decoding its body again.
+        """
+        cache_key = _request_key(method, url, params)
+        metrics = self.metrics.endpoint(url)
+        attempt = 0
+        while True:
+            cached = self._cache.get(cache_key) if method == "get" else None
+            await self._throttle.async_acquire()
+            started = time.perf_counter()
+            try:
+                async with async_timeout.timeout(self._timeout):
+                    response = await self._session.request(
+                        method=method,
+                        url=url,
+                        headers={**self._headers, **_conditional_headers(cached)},
+                        params=params,
+                        json=data,
+                    )
+                    if cached is not None and response.status == 304:
+                        self._cache.hits += 1
+                        metrics.record_not_modified(started)
+                        return cached.body
+                    _verify_response_or_raise(response)
+                    body = await response.read()
+                    metrics.record_response(started, len(body))
+                    decode_started = time.perf_counter()
+                    result = json_loads(body)
+                    metrics.decode_ms += elapsed_ms(decode_started)
+                    if method == "get":
+                        self._cache.misses += 1
+                        self._cache.put(cache_key, response.headers, result, len(body))
+                    return result
+
+            except HevyApiClientError:
+                metrics.record_error(started)
+                raise
+            except (TimeoutError, aiohttp.ClientError, socket.gaierror) as exception:
+                metrics.record_error(started)
+                await self._async_backoff(url, attempt, exception)
+                attempt += 1
+            except Exception as exception:  # pylint: disable=broad-except
+                msg = f"Something really wrong happened! - {exception}"
+                raise HevyApiClientError(
+                    msg,
+                ) from exception
+
+    async def _async_stream(
+        self, url: str, params: dict, key: str
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream the items of an array field of a JSON response.
+
+        The body is read chunk by chunk and each item is decoded as soon as it
+        is complete. Failures before the first item are retried; later ones
+        are raised, as the caller has already consumed part of the response.
+        """
+        metrics = self.metrics.endpoint(url)
+        attempt = 0
+        while True:
+            await self._throttle.async_acquire()
+            items = _JsonItemStream(key)
+            streamed = False
+            size = 0
+            started = time.perf_counter()
+            try:
+                async with async_timeout.timeout(self._timeout):
+                    response = await self._session.request(
+                        method="get", url=url, headers=self._headers, params=params
+                    )
+                async with response:
+                    _verify_response_or_raise(response)
+                    while True:
+                        # Time out a stalled body, not a large one
+                        async with async_timeout.timeout(self._timeout):
+                            chunk = await response.content.readany()
+                        if not chunk:
+                            break
+                        size += len(chunk)
+                        for item in items.feed(chunk):
+                            streamed = True
+                            decode_started = time.perf_counter()
+                            workout = json_loads(item)
+                            metrics.decode_ms += elapsed_ms(decode_started)
+                            yield workout
+
+            except HevyApiClientError:
+                metrics.record_error(started)
+                raise
+            except (TimeoutError, aiohttp.ClientError, socket.gaierror) as exception:
+                metrics.record_error(started)
+                if streamed:
+                    raise _communication_error(exception) from exception
+                await self._async_backoff(url, attempt, exception)
+                attempt += 1
+            except Exception as exception:  # pylint: disable=broad-except
+                msg = f"Something really wrong happened! - {exception}"
+                raise HevyApiClientError(
+                    msg,
+                ) from exception
+            else:
+                if not items.complete:
+                    metrics.record_error(started)
+                    msg = f"Truncated response from {url}"
+                    raise HevyApiClientCommunicationError(msg)
+                metrics.record_response(started, size)
+                return
+
+    async def _async_backoff(
+        self, url: str, attempt: int, exception: Exception
+    ) -> None:
+        """Wait before retrying a failed attempt, or raise when giving up."""
+        delay = self._retry_delay(attempt, exception)
+        if delay is None:
+            raise _communication_error(exception) from exception
+        LOGGER.debug(
+            "Retrying %s in %.1fs after attempt %s failed: %s",
+            url,
+            delay,
+            attempt + 1,
+            exception,
+        )
+        await asyncio.sleep(delay)
+
+    def _retry_delay(self, attempt: int, exception: Exception) -> float | None:
+        """Return how long to wait before retrying, or None to give up."""
+        if attempt >= self._max_retries:
+            return None
+        if isinstance(exception, aiohttp.ClientResponseError):
+            if exception.status == 429:
+                retry_after = _parse_retry_after(
+                    exception.headers.get("Retry-After") if exception.headers else None
                 )
-                _verify_response_or_raise(response)
-                return await response.json()
-
-        except TimeoutError as exception:
-            msg = f"Timeout error fetching information - {exception}"
-            raise HevyApiClientCommunicationError(
-                msg,
-            ) from exception
-        except (aiohttp.ClientError, socket.gaierror) as exception:
-            msg = f"Error fetching information - {exception}"
-            raise HevyApiClientCommunicationError(
-                msg,
-            ) from exception
-        except Exception as exception:  # pylint: disable=broad-except
-            msg = f"Something really wrong happened! - {exception}"
-            raise HevyApiClientError(
-                msg,
-            ) from exception
+                if retry_after is not None:
+                    if retry_after > RETRY_AFTER_MAX:
+                        return None
+                    # Hold back every request of this client, not just this one
+                    self._throttle.pause(retry_after)
+                    return retry_after
+            elif exception.status < 500:
+                return None
+        # Exponential backoff with full jitter
+        backoff = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt)
+        return random.uniform(0, backoff)  # noqa: S311
+
+
+def _forget_request(
+    in_flight: dict[tuple, asyncio.Task], key: tuple, task: asyncio.Task
+) -> None:
+    """Remove a finished request from the in-flight requests."""
+    if in_flight.get(key) is task:
+        del in_flight[key]
+    if not task.cancelled():
+        # Mark the exception as retrieved when every caller was cancelled
+        task.exception()
+
+
+def _is_outage(exception: BaseException | None) -> bool:
+    """Return whether a transport exception shows the API is failing."""
+    if isinstance(exception, aiohttp.ClientResponseError):
+        return exception.status == 429 or exception.status >= 500
+    return True
+
+
+def _communication_error(exception: Exception) -> HevyApiClientCommunicationError:
+    """Map a transport exception to a client error."""
+    if isinstance(exception, aiohttp.ClientResponseError) and exception.status == 429:
+        msg = f"Rate limited fetching information - {exception}"
+        return HevyApiClientRateLimitError(msg)
+    if isinstance(exception, TimeoutError):
+        msg = f"Timeout error fetching information - {exception}"
+        return HevyApiClientCommunicationError(msg)
+    msg = f"Error fetching information - {exception}"
+    return HevyApiClientCommunicationError(msg)
@@ -0,0 +1,148 @@
+"""Full-history backfill for hevy."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING
+
+from .const import BACKFILL_CONCURRENCY, BACKFILL_PAGE_SIZE, LOGGER
+
+if TYPE_CHECKING:
+    from .api import HevyApiClient
+    from .store import HevyWorkoutStore
+
+
+class HevyBackfill:
+    """Fetch a user's whole workout history into the workout store."""
+
+    def __init__(
+        self,
+        client: HevyApiClient,
+        store: HevyWorkoutStore,
+        page_size: int = BACKFILL_PAGE_SIZE,
+        concurrency: int = BACKFILL_CONCURRENCY,
+    ) -> None:
+        """Initialize the backfill."""
+        self._client = client
+        self._store = store
+        self._page_size = page_size
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    def plan(self, workout_count: int) -> list[int]:
+        """
+        Return the page offsets that have not been backfilled yet.
+
+        The covered ranges at both ends of the history hold exactly the upstream
+        workouts, so their offsets follow from the stored workouts. Pages start
+        on the oldest workout of the newest range and overlap the next page by
+        one workout, which joins their ranges once both are fetched.
+        """
+        covered = self._store.covered
+        if self.is_complete():
+            return []
+        start_times = sorted(
+            workout["start_time"] for workout in self._store.workouts.values()
+        )
+        first = 0
+        if covered and covered[-1][1] == math.inf:
+            first = max(
+                len(start_times) - bisect_left(start_times, covered[-1][0]) - 1, 0
+            )
+        last = workout_count
+        if covered and covered[0][0] == -math.inf:
+            last -= bisect_right(start_times, covered[0][1])
+        return list(range(first, max(last, first + 1), self._page_size))
+
+    def is_complete(self) -> bool:
+        """Return whether the whole history has been backfilled."""
+        return self._store.covered == [[-math.inf, math.inf]]
+
+    async def async_run(self, workout_count: int) -> None:
+        """
+        Fetch every missing page of the history.
+
+        Each finished page is checkpointed in the store by the start times it
+        spans, so an interrupted backfill resumes with the gaps that are still
+        missing. Workouts added or deleted while it runs shift the later pages,
+        which then leave a gap for the next run instead of a wrong checkpoint.
+        """
+        offsets = self.plan(workout_count)
+        if not offsets:
+            return
+        LOGGER.debug("Backfilling %s pages of workout history", len(offsets))
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                for offset in offsets:
+                    task_group.create_task(self._async_fetch_page(offset))
+        except ExceptionGroup as exception_group:
+            # Surface the first API error like any other client call
+            raise exception_group.exceptions[0] from exception_group
+
+    async def async_drop_deleted(self) -> None:
+        """
+        Drop stored workouts deleted upstream from older than the newest window.
+
+        The newest covered range holds the upstream workouts in order, so the
+        first stored workout that no longer matches its offset is found with a
+        binary search of single workout requests. A matching oldest workout
+        costs one request and means nothing was deleted.
+        """
+        covered = self._store.covered
+        while covered and covered[-1][1] == math.inf:
+            stored = sorted(
+                (
+                    workout
+                    for workout in self._store.workouts.values()
+                    if workout["start_time"] >= covered[-1][0]
+                ),
+                key=lambda workout: workout["start_time"],
+                reverse=True,
+            )
+            oldest = len(stored) - 1
+            if not stored or await self._async_id_at(oldest) == stored[oldest]["id"]:
+                return
+            low, high = 0, oldest
+            while low < high:
+                middle = (low + high) // 2
+                if await self._async_id_at(middle) == stored[middle]["id"]:
+                    low = middle + 1
+                else:
+                    high = middle
+            workouts_data = await self._client.async_get_workouts(limit=1, offset=high)
+            if (workouts := workouts_data.get("workouts", [])) and workouts[0][
+                "start_time"
+            ] >= stored[high]["start_time"]:
+                # Not a deletion, like a workout added meanwhile, which the next
+                # update fetches
+                return
+            LOGGER.debug("Dropping deleted workout %s", stored[high]["id"])
+            del self._store.workouts[stored[high]["id"]]
+            self._store.async_schedule_save()
+
+    async def _async_id_at(self, offset: int) -> str | None:
+        """Return the id of the upstream workout at ``offset``, newest first."""
+        workouts_data = await self._client.async_get_workouts(limit=1, offset=offset)
+        if workouts := workouts_data.get("workouts", []):
+            return workouts[0]["id"]
+        return None
+
+    async def _async_fetch_page(self, offset: int) -> None:
+        """Stream one page into the store, merging workouts as they arrive."""
+        limit = self._page_size + 1
+        workout_ids: set[str] = set()
+        start_times: list[float] = []
+        async with self._semaphore:
+            async for workout in self._client.async_iter_workouts(
+                limit=limit, offset=offset
+            ):
+                self._store.merge([workout])
+                workout_ids.add(workout["id"])
+                start_times.append(workout["start_time"])
+        if not start_times:
+            return
+        # A short page reached the oldest workout
+        start = min(start_times) if len(start_times) == limit else -math.inf
+        self._store.mark_fetched(workout_ids, start, max(start_times))
+        self._store.async_schedule_save()
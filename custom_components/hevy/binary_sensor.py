@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any, Final
 
 from homeassistant.components.binary_sensor import (
@@ -45,12 +44,7 @@ WORKOUT_TODAY_DESCRIPTION: Final = HevyBinarySensorEntityDescription(
     device_class=BinarySensorDeviceClass.MOTION,
     icon="mdi:weight-lifter",
     entity_category=EntityCategory.DIAGNOSTIC,
-    is_on_fn=lambda data: any(
-        [
-            workout.get("start_time", datetime.min).date() == datetime.now().date()
-            for workout in data.get("workouts", {}).values()
-        ]
-    ),
+    is_on_fn=lambda data: data.get("today_count", 0) > 0,
 )
 
 WORKOUT_WEEK_DESCRIPTION: Final = HevyBinarySensorEntityDescription(
@@ -59,13 +53,7 @@ WORKOUT_WEEK_DESCRIPTION: Final = HevyBinarySensorEntityDescription(
     device_class=BinarySensorDeviceClass.MOTION,
     icon="mdi:calendar-week",
     entity_category=EntityCategory.DIAGNOSTIC,
-    is_on_fn=lambda data: any(
-        (
-            datetime.now().date() - workout.get("start_time", datetime.min).date()
-            < timedelta(days=7)
-            for workout in data.get("workouts", {}).values()
-        )
-    ),
+    is_on_fn=lambda data: data.get("week_count", 0) > 0,
 )
 
 
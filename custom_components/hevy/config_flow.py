@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.core import callback
 from homeassistant.helpers import selector
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import (
     HevyApiClient,
@@ -13,7 +14,23 @@ from .api import (
     HevyApiClientCommunicationError,
     HevyApiClientError,
 )
-from .const import CONF_AUTH_TOKEN, CONF_USERNAME, CONF_NAME, CONF_X_API_KEY, DEFAULT_X_API_KEY, DOMAIN, LOGGER
+from .const import (
+    BASE_URL,
+    CONF_AUTH_TOKEN,
+    CONF_BASE_URL,
+    CONF_FULL_HISTORY,
+    CONF_MAX_INTERVAL,
+    CONF_MIN_INTERVAL,
+    CONF_NAME,
+    CONF_USERNAME,
+    CONF_X_API_KEY,
+    DEFAULT_FULL_HISTORY,
+    DEFAULT_MAX_INTERVAL,
+    DEFAULT_MIN_INTERVAL,
+    DEFAULT_X_API_KEY,
+    DOMAIN,
+    LOGGER,
+)
 
 
 class HevyFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
@@ -21,6 +38,14 @@ class HevyFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,  # noqa: ARG004
+    ) -> HevyOptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return HevyOptionsFlowHandler()
+
     async def async_step_user(
         self,
         user_input: dict | None = None,
@@ -31,12 +56,13 @@ class HevyFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             # Set default x_api_key if not provided
             if CONF_X_API_KEY not in user_input or not user_input[CONF_X_API_KEY]:
                 user_input[CONF_X_API_KEY] = DEFAULT_X_API_KEY
-                
+
             try:
                 await self._test_credentials(
                     auth_token=user_input[CONF_AUTH_TOKEN],
                     username=user_input[CONF_USERNAME],
                     x_api_key=user_input[CONF_X_API_KEY],
+                    base_url=user_input.get(CONF_BASE_URL, BASE_URL),
                 )
             except HevyApiClientAuthenticationError as exception:
                 LOGGER.warning(exception)
@@ -48,60 +74,132 @@ class HevyFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 LOGGER.exception(exception)
                 _errors["base"] = "unknown"
             else:
-                await self.async_set_unique_id(f"{user_input[CONF_USERNAME]}_{user_input[CONF_AUTH_TOKEN][:8]}")
+                await self.async_set_unique_id(
+                    f"{user_input[CONF_USERNAME]}_{user_input[CONF_AUTH_TOKEN][:8]}"
+                )
                 self._abort_if_unique_id_configured()
                 return self.async_create_entry(
                     title=f"Hevy - {user_input[CONF_NAME]}",
                     data=user_input,
                 )
 
-        return self.async_show_form(
-            step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_NAME,
-                        default=(user_input or {}).get(CONF_NAME, vol.UNDEFINED),
-                    ): selector.TextSelector(
-                        selector.TextSelectorConfig(
-                            type=selector.TextSelectorType.TEXT,
-                        ),
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_NAME,
+                    default=(user_input or {}).get(CONF_NAME, vol.UNDEFINED),
+                ): selector.TextSelector(
+                    selector.TextSelectorConfig(
+                        type=selector.TextSelectorType.TEXT,
                     ),
-                    vol.Required(
-                        CONF_USERNAME,
-                        default=(user_input or {}).get(CONF_USERNAME, vol.UNDEFINED),
-                    ): selector.TextSelector(
-                        selector.TextSelectorConfig(
-                            type=selector.TextSelectorType.TEXT,
-                        ),
+                ),
+                vol.Required(
+                    CONF_USERNAME,
+                    default=(user_input or {}).get(CONF_USERNAME, vol.UNDEFINED),
+                ): selector.TextSelector(
+                    selector.TextSelectorConfig(
+                        type=selector.TextSelectorType.TEXT,
                     ),
-                    vol.Required(
-                        CONF_AUTH_TOKEN,
-                        default=(user_input or {}).get(CONF_AUTH_TOKEN, vol.UNDEFINED),
-                    ): selector.TextSelector(
-                        selector.TextSelectorConfig(
-                            type=selector.TextSelectorType.PASSWORD,
-                        ),
+                ),
+                vol.Required(
+                    CONF_AUTH_TOKEN,
+                    default=(user_input or {}).get(CONF_AUTH_TOKEN, vol.UNDEFINED),
+                ): selector.TextSelector(
+                    selector.TextSelectorConfig(
+                        type=selector.TextSelectorType.PASSWORD,
                     ),
+                ),
+                vol.Optional(
+                    CONF_X_API_KEY,
+                    default=(user_input or {}).get(CONF_X_API_KEY, DEFAULT_X_API_KEY),
+                ): selector.TextSelector(
+                    selector.TextSelectorConfig(
+                        type=selector.TextSelectorType.TEXT,
+                    ),
+                ),
+            },
+        )
+        if self.show_advanced_options:
+            # Point the integration at a local stand-in of the API for testing
+            schema = schema.extend(
+                {
                     vol.Optional(
-                        CONF_X_API_KEY,
-                        default=(user_input or {}).get(CONF_X_API_KEY, DEFAULT_X_API_KEY),
+                        CONF_BASE_URL,
+                        default=(user_input or {}).get(CONF_BASE_URL, BASE_URL),
                     ): selector.TextSelector(
                         selector.TextSelectorConfig(
-                            type=selector.TextSelectorType.TEXT,
+                            type=selector.TextSelectorType.URL,
                         ),
                     ),
-                },
-            ),
+                }
+            )
+
+        return self.async_show_form(
+            step_id="user",
+            data_schema=schema,
             errors=_errors,
         )
 
-    async def _test_credentials(self, auth_token: str, username: str, x_api_key: str = DEFAULT_X_API_KEY) -> None:
+    async def _test_credentials(
+        self,
+        auth_token: str,
+        username: str,
+        x_api_key: str = DEFAULT_X_API_KEY,
+        base_url: str = BASE_URL,
+    ) -> None:
         """Validate authentication credentials."""
         client = HevyApiClient(
             auth_token=auth_token,
             username=username,
-            session=async_create_clientsession(self.hass),
+            session=async_get_clientsession(self.hass),
             x_api_key=x_api_key,
+            base_url=base_url,
         )
         await client.async_get_workouts()
+
+
+class HevyOptionsFlowHandler(config_entries.OptionsFlow):
+    """Options flow for Hevy."""
+
+    async def async_step_init(
+        self,
+        user_input: dict | None = None,
+    ) -> config_entries.ConfigFlowResult:
+        """Manage the options."""
+        _errors = {}
+        if user_input is not None:
+            if user_input[CONF_MIN_INTERVAL] > user_input[CONF_MAX_INTERVAL]:
+                _errors["base"] = "interval_range"
+            else:
+                return self.async_create_entry(data=user_input)
+
+        options = user_input or self.config_entry.options
+        interval_selector = selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=5,
+                max=1440,
+                step=5,
+                unit_of_measurement="min",
+                mode=selector.NumberSelectorMode.BOX,
+            ),
+        )
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_FULL_HISTORY,
+                        default=options.get(CONF_FULL_HISTORY, DEFAULT_FULL_HISTORY),
+                    ): selector.BooleanSelector(),
+                    vol.Required(
+                        CONF_MIN_INTERVAL,
+                        default=options.get(CONF_MIN_INTERVAL, DEFAULT_MIN_INTERVAL),
+                    ): interval_selector,
+                    vol.Required(
+                        CONF_MAX_INTERVAL,
+                        default=options.get(CONF_MAX_INTERVAL, DEFAULT_MAX_INTERVAL),
+                    ): interval_selector,
+                },
+            ),
+            errors=_errors,
+        )
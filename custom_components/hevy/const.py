@@ -10,9 +10,71 @@ CONF_AUTH_TOKEN = "auth_token"
 CONF_USERNAME = "username"
 CONF_NAME = "name"
 CONF_X_API_KEY = "x_api_key"
+CONF_BASE_URL = "base_url"
+CONF_FULL_HISTORY = "full_history"
+CONF_MIN_INTERVAL = "min_interval"
+CONF_MAX_INTERVAL = "max_interval"
 BASE_URL = "https://api.hevyapp.com"
 
 DEFAULT_X_API_KEY = "shelobs_hevy_web"
 
 DEFAULT_WORKOUTS_COUNT = 5
 DEFAULT_SCAN_INTERVAL = 60  # minutes
+DEFAULT_DETAIL_INTERVAL = 360  # minutes
+DEFAULT_FULL_HISTORY = False
+DEFAULT_MIN_INTERVAL = 15  # minutes
+DEFAULT_MAX_INTERVAL = 240  # minutes
+
+ADAPTIVE_BOOST_DURATION = 60  # minutes
+ADAPTIVE_LOOKBACK_HOURS = 2
+
+BACKFILL_PAGE_SIZE = 10
+BACKFILL_CONCURRENCY = 4
+
+FINGERPRINT_SUMMARY = "summary"
+
+# Sets listed in the exercise sensor attributes, the rest is left to the service
+MAX_ATTRIBUTE_SETS = 10
+
+SERVICE_GET_EXERCISE_SETS = "get_exercise_sets"
+SERVICE_QUERY_WORKOUTS = "query_workouts"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+DEFAULT_QUERY_LIMIT = 50
+MAX_QUERY_LIMIT = 500
+
+ACUTE_LOAD_DAYS = 7
+CHRONIC_LOAD_DAYS = 28
+# Weeks the volume trends are fitted over, and the exercise trends listed
+TREND_WEEKS = 8
+MAX_EXERCISE_TRENDS = 10
+# Upper bounds of the intensity buckets, in percent of the estimated 1RM
+INTENSITY_BUCKETS = (60, 70, 80, 90)
+
+EVENT_PERSONAL_RECORD = f"{DOMAIN}_personal_record"
+# Sets with more reps do not estimate a one rep max reliably
+E1RM_MAX_REPS = 12
+
+REQUEST_TIMEOUT = 10  # seconds
+REQUEST_RATE = 2.0  # requests per second
+REQUEST_BURST = 5
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1.0  # seconds
+RETRY_MAX_DELAY = 30.0  # seconds
+RETRY_AFTER_MAX = 120.0  # seconds
+
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_RESET_TIMEOUT = 60.0  # seconds
+CIRCUIT_MAX_RESET_TIMEOUT = 30 * 60.0  # seconds
+STALE_MAX_AGE = 24 * 60 * 60  # seconds
+
+CACHE_MAX_BYTES = 4 * 1024 * 1024
+CACHE_MAX_AGE = 24 * 60 * 60  # seconds
+
+STATISTICS_BATCH_SIZE = 500
+# Workouts modeled before yielding to the event loop
+PROCESS_BATCH_SIZE = 250
+
+LATENCY_BUCKETS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)  # milliseconds
+
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10  # seconds
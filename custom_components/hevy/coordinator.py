@@ -2,32 +2,68 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
+import asyncio
+import heapq
+import time
+from contextlib import contextmanager
+from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
+from .activity import ActivityIndex
+from .analytics import training_analytics
 from .api import (
     HevyApiClientAuthenticationError,
+    HevyApiClientCommunicationError,
     HevyApiClientError,
 )
-from .const import DEFAULT_WORKOUTS_COUNT, DOMAIN, LOGGER
+from .backfill import HevyBackfill
+from .const import (
+    CONF_FULL_HISTORY,
+    CONF_MAX_INTERVAL,
+    CONF_MIN_INTERVAL,
+    DEFAULT_FULL_HISTORY,
+    DEFAULT_MAX_INTERVAL,
+    DEFAULT_MIN_INTERVAL,
+    DEFAULT_WORKOUTS_COUNT,
+    DOMAIN,
+    FINGERPRINT_SUMMARY,
+    LOGGER,
+    PROCESS_BATCH_SIZE,
+    STALE_MAX_AGE,
+)
+from .metrics import elapsed_ms
+from .models import Workout
+from .records import PersonalRecords
+from .scheduler import AdaptivePollScheduler
+from .set_table import SetTable
+from .statistics import HevyStatistics
+from .training_load import TrainingLoad
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from datetime import date, datetime
+
     from homeassistant.core import HomeAssistant
 
     from .data import HevyConfigEntry
+    from .store import HevyWorkoutStore
 
 
-class HevyDataUpdateCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching data from the API."""
+class HevyCoordinator(DataUpdateCoordinator):
+    """Base class of the Hevy coordinators."""
 
     config_entry: HevyConfigEntry
 
     def __init__(
         self,
         hass: HomeAssistant,
+        config_entry: HevyConfigEntry,
         name: str,
         update_interval: timedelta,
     ) -> None:
@@ -35,106 +71,482 @@ class HevyDataUpdateCoordinator(DataUpdateCoordinator):
         super().__init__(
             hass=hass,
             logger=LOGGER,
+            config_entry=config_entry,
             name=DOMAIN,
             update_interval=update_interval,
         )
         self.name = name
         self.data: dict[str, Any] = {}
+        # Content fingerprints per workout id and for the aggregate values
+        self.fingerprints: dict[str, int] = {}
+        self.suppressed_writes = 0
+        self.state_writes = 0
+        # State writes and skipped writes caused by the last update
+        self.last_update_writes = (0, 0)
+        # When the data was fetched, and when the API first failed while it is
+        # still being served
+        self.fetched_at: datetime | None = None
+        self.stale_since: datetime | None = None
+
+    def _update_fingerprints(self, data: dict[str, Any]) -> None:
+        """Fingerprint each slice of the data that entities read."""
+        self.fingerprints = {FINGERPRINT_SUMMARY: hash(json_bytes(data))}
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all listeners and count the state writes they caused."""
+        writes, suppressed = self.state_writes, self.suppressed_writes
+        super().async_update_listeners()
+        self.last_update_writes = (
+            self.state_writes - writes,
+            self.suppressed_writes - suppressed,
+        )
+
+    @property
+    def diagnostics(self) -> dict[str, Any]:
+        """Return the update state for diagnostics."""
+        return {
+            "last_update_success": self.last_update_success,
+            "update_interval": (
+                self.update_interval.total_seconds() if self.update_interval else None
+            ),
+            "fetched_at": self.fetched_at,
+            "stale_since": self.stale_since,
+            "state_writes": self.state_writes,
+            "suppressed_writes": self.suppressed_writes,
+            "last_update_writes": dict(
+                zip(("written", "suppressed"), self.last_update_writes, strict=True)
+            ),
+        }
+
+    @callback
+    def async_restore(self, data: dict[str, Any], fetched_at: float | None) -> None:
+        """Publish data restored from storage until the next refresh."""
+        self.fetched_at = (
+            None if fetched_at is None else dt_util.utc_from_timestamp(fetched_at)
+        )
+        self._update_fingerprints(data)
+        self.async_set_updated_data(data)
+
+    def _serve_stale(
+        self, exception: HevyApiClientCommunicationError
+    ) -> dict[str, Any]:
+        """
+        Keep serving the last data while the API is unreachable.
+
+        Entities stay available and show a ``stale_since`` attribute instead,
+        until the data was fetched more than ``STALE_MAX_AGE`` ago and the
+        update fails. Restored data counts from when it was fetched, too.
+        """
+        now = dt_util.utcnow()
+        if (
+            not self.data
+            or self.fetched_at is None
+            or now - self.fetched_at > timedelta(seconds=STALE_MAX_AGE)
+        ):
+            raise UpdateFailed(exception) from exception
+        if self.stale_since is None:
+            LOGGER.warning(
+                "Serving the last known data of %s until the API recovers: %s",
+                self.name,
+                exception,
+            )
+            self.stale_since = now
+        else:
+            LOGGER.debug("Still serving stale data of %s: %s", self.name, exception)
+        return self.data
+
+
+class HevyWorkoutCountCoordinator(HevyCoordinator):
+    """Class to poll the cheap workout count endpoint."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: HevyConfigEntry,
+        name: str,
+        update_interval: timedelta,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(hass, config_entry, name, update_interval)
+        options = config_entry.options
+        self.scheduler = AdaptivePollScheduler(
+            min_interval=timedelta(
+                minutes=options.get(CONF_MIN_INTERVAL, DEFAULT_MIN_INTERVAL)
+            ),
+            max_interval=timedelta(
+                minutes=options.get(CONF_MAX_INTERVAL, DEFAULT_MAX_INTERVAL)
+            ),
+            default_interval=update_interval,
+        )
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Update data via library."""
         try:
-            # Get workout count
-            workout_count_data = await self.config_entry.runtime_data.client.async_get_workout_count()
-            
-            # Get workouts data
-            workouts_data = (
-                await self.config_entry.runtime_data.client.async_get_workouts(
-                    limit=DEFAULT_WORKOUTS_COUNT, offset=0
-                )
+            workout_count_data = (
+                await self.config_entry.runtime_data.client.async_get_workout_count()
             )
+        except HevyApiClientAuthenticationError as exception:
+            raise ConfigEntryAuthFailed(exception) from exception
+        except HevyApiClientCommunicationError as exception:
+            return self._serve_stale(exception)
+        except HevyApiClientError as exception:
+            raise UpdateFailed(exception) from exception
+
+        self.stale_since = None
+        workout_count = workout_count_data.get("workout_count", 0)
+        now = self.fetched_at = dt_util.utcnow()
+        if self.data and workout_count != self.data["workout_count"]:
+            self.scheduler.note_change(now)
+        self.update_interval = self.scheduler.next_interval(now)
+        LOGGER.debug(
+            "Workout count of %s is %s, next probe in %s",
+            self.name,
+            workout_count,
+            self.update_interval,
+        )
+
+        data = {"workout_count": workout_count}
+        self._update_fingerprints(data)
+        return data
+
 
-            # Process workouts into a more usable format
-            processed_workouts = {}
-
-            # Track counts for different time periods
-            today_count = 0
-            week_count = 0
-            month_count = 0
-            year_count = 0
-
-            today = datetime.now().date()
-            total_workout_count = 0
-
-            for workout in workouts_data.get("workouts", []):
-                total_workout_count += 1
-                workout_id = workout["id"]
-                workout_start_time = datetime.fromtimestamp(workout["start_time"], tz=timezone.utc)
-                workout_name = workout["name"]
-
-                workout_date = workout_start_time.date()
-                if workout_date == today:
-                    today_count += 1
-
-                days_diff = (today - workout_date).days
-                if days_diff < 7:
-                    week_count += 1
-
-                if (
-                    workout_date.year == today.year
-                    and workout_date.month == today.month
-                ):
-                    month_count += 1
-
-                if workout_date.year == today.year:
-                    year_count += 1
-
-                exercises_data = {}
-                for exercise in workout["exercises"]:
-                    exercise_title = exercise["title"]
-                    exercise_data = {
-                        "title": exercise_title,
-                        "sets": len(exercise["sets"]),
-                        "total_reps": sum(
-                            s.get("reps", 0)
-                            for s in exercise["sets"]
-                            if s.get("reps") is not None
-                        ),
-                        "max_weight_kg": max(
-                            (
-                                s.get("weight_kg", 0)
-                                for s in exercise["sets"]
-                                if s.get("weight_kg") is not None
-                            ),
-                            default=0,
-                        ),
-                    }
-                    # Using exercise id as key instead of index_title
-                    exercises_data[exercise["id"]] = exercise_data
-
-                processed_workouts[workout_id] = {
-                    "id": workout_id,
-                    "title": workout_name,
-                    "start_time": workout_start_time,
-                    "exercises": exercises_data,
-                    "estimated_volume_kg": workout.get("estimated_volume_kg", 0),
-                }
-
-            # Get total workout count from the dedicated API endpoint
-            total_workout_count = workout_count_data.get("workout_count", 0)
-            
-            # Combine data
-            return {
-                "workout_count": total_workout_count,  # Use the dedicated workout_count endpoint
-                "workouts": processed_workouts,
-                "name": self.name,
-                "today_count": today_count,
-                "week_count": week_count,
-                "month_count": month_count,
-                "year_count": year_count,
-            }
+class HevyDataUpdateCoordinator(HevyCoordinator):
+    """Class to manage fetching workout details from the API."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: HevyConfigEntry,
+        name: str,
+        update_interval: timedelta,
+        count_coordinator: HevyWorkoutCountCoordinator,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(hass, config_entry, name, update_interval)
+        self.count_coordinator = count_coordinator
+        self._backfill_task: asyncio.Task | None = None
+        self.stage_timings: dict[str, float] = {}
+        # Workouts modeled by the last processing stage
+        self.modeled_workouts = 0
+        # Id index of every stored workout and the raw data it was built from
+        self.workouts: dict[str, Workout] = {}
+        self._workout_sources: dict[str, dict[str, Any]] = {}
+        # Indexing yields to the event loop, so updates and backfills take turns
+        self._index_lock = asyncio.Lock()
+        # Workout and exercise ids of the exercise sensors, by unique id
+        self.exercise_sensors: dict[str, tuple[str, str]] = {}
+        self.activity = ActivityIndex()
+        self.training_load = TrainingLoad()
+        # Every set of the indexed workouts, for analytics over the history
+        self.sets = SetTable()
+        # Analytics of the set table revision and local day they were run for
+        self._analytics: dict[str, Any] = {}
+        self._analytics_key: tuple[int, date] | None = None
+        self.statistics = HevyStatistics(hass, config_entry.entry_id, name)
+        self.records = PersonalRecords(hass, config_entry.entry_id, name)
+
+    @callback
+    def async_handle_count_update(self) -> None:
+        """Refresh the details when the probe saw the workout count move."""
+        count_coordinator = self.count_coordinator
+        if (
+            count_coordinator.last_update_success
+            and count_coordinator.stale_since is None
+            and count_coordinator.data
+            and count_coordinator.data["workout_count"]
+            != self.config_entry.runtime_data.store.workout_count
+        ):
+            self.config_entry.async_create_task(self.hass, self.async_request_refresh())
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Update data via library."""
+        started = time.perf_counter()
+        try:
+            with self._stage("fetch"):
+                workout_count = await self._async_fetch_workouts()
 
         except HevyApiClientAuthenticationError as exception:
             raise ConfigEntryAuthFailed(exception) from exception
+        except HevyApiClientCommunicationError as exception:
+            return self._serve_stale(exception)
         except HevyApiClientError as exception:
             raise UpdateFailed(exception) from exception
+
+        self.stale_since = None
+        if self.config_entry.options.get(CONF_FULL_HISTORY, DEFAULT_FULL_HISTORY):
+            self._start_backfill(workout_count)
+
+        with self._stage("process"):
+            data = await self._async_process_workouts(workout_count)
+
+        with self._stage("statistics"):
+            self.statistics.async_import(self.config_entry.runtime_data.store)
+
+        with self._stage("records"):
+            self.records.async_commit(self.config_entry.runtime_data.store)
+
+        self.stage_timings["total"] = elapsed_ms(started)
+        if self.modeled_workouts:
+            # Analytics run over the whole history, whatever was modeled
+            self.stage_timings["process_per_workout"] = round(
+                (self.stage_timings["process"] - self.stage_timings["analytics"])
+                / self.modeled_workouts,
+                3,
+            )
+        else:
+            self.stage_timings.pop("process_per_workout", None)
+        LOGGER.debug(
+            "Updated %s, stage timings (ms): %s", self.name, self.stage_timings
+        )
+        return data
+
+    @contextmanager
+    def _stage(self, stage: str) -> Iterator[None]:
+        """Record how long an update stage took."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_timings[stage] = elapsed_ms(started)
+
+    def _start_backfill(self, workout_count: int) -> None:
+        """Start a background backfill unless one is running or it is done."""
+        if self._backfill_task is not None and not self._backfill_task.done():
+            return
+        backfill = HevyBackfill(
+            self.config_entry.runtime_data.client,
+            self.config_entry.runtime_data.store,
+        )
+        if backfill.is_complete():
+            return
+        self._backfill_task = self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_backfill(backfill, workout_count),
+            name=f"{DOMAIN} backfill {self.name}",
+        )
+
+    async def _async_backfill(self, backfill: HevyBackfill, workout_count: int) -> None:
+        """Backfill the workout history and publish the merged data."""
+        try:
+            await backfill.async_run(workout_count)
+        except HevyApiClientError as exception:
+            LOGGER.warning(
+                "Workout history backfill interrupted, resuming on next update: %s",
+                exception,
+            )
+        self.async_set_updated_data(await self._async_process_workouts(workout_count))
+        self.statistics.async_import(self.config_entry.runtime_data.store)
+        self.records.async_commit(self.config_entry.runtime_data.store)
+
+    async def _async_workout_count(self) -> int:
+        """Return the workout count seen by the probe, fetching it if unknown."""
+        count_coordinator = self.count_coordinator
+        if (
+            count_coordinator.last_update_success
+            and count_coordinator.stale_since is None
+            and count_coordinator.data
+        ):
+            return count_coordinator.data["workout_count"]
+        workout_count_data = (
+            await self.config_entry.runtime_data.client.async_get_workout_count()
+        )
+        return workout_count_data.get("workout_count", 0)
+
+    async def _async_fetch_workouts(self) -> int:
+        """Fetch the workouts missing from the store."""
+        client = self.config_entry.runtime_data.client
+        store = self.config_entry.runtime_data.store
+
+        if store.workout_count is None:
+            # Cold store: the newest window is needed whatever the count is,
+            # so fetch it alongside the count
+            workout_count, workouts_data = await asyncio.gather(
+                self._async_workout_count(),
+                client.async_get_workouts(limit=DEFAULT_WORKOUTS_COUNT, offset=0),
+            )
+            self._resync_window(workouts_data)
+        else:
+            workout_count = await self._async_workout_count()
+            if workout_count == store.workout_count:
+                # Fallback refresh: revalidate the newest window to pick up
+                # edited workouts, which is usually answered by a cached 304
+                workouts_data = await client.async_get_workouts(
+                    limit=DEFAULT_WORKOUTS_COUNT, offset=0
+                )
+                workouts = workouts_data.get("workouts", [])
+                store.replace_window(
+                    workouts, complete=len(workouts) < DEFAULT_WORKOUTS_COUNT
+                )
+            elif workout_count < store.workout_count:
+                workouts_data = await client.async_get_workouts(
+                    limit=DEFAULT_WORKOUTS_COUNT, offset=0
+                )
+                self._resync_window(workouts_data)
+                # Deletions older than the window are not in it, look them up
+                await HevyBackfill(client, store).async_drop_deleted()
+            else:
+                # The missing pages are known from the count, fetch them together
+                pages = await asyncio.gather(
+                    *(
+                        client.async_get_workouts(
+                            limit=DEFAULT_WORKOUTS_COUNT, offset=offset
+                        )
+                        for offset in range(
+                            0,
+                            workout_count - store.workout_count,
+                            DEFAULT_WORKOUTS_COUNT,
+                        )
+                    )
+                )
+                # The pages run back from the newest workout without gaps
+                store.replace_window(
+                    [
+                        workout
+                        for workouts_data in pages
+                        for workout in workouts_data.get("workouts", [])
+                    ],
+                    complete=len(pages[-1].get("workouts", []))
+                    < DEFAULT_WORKOUTS_COUNT,
+                )
+
+        self.fetched_at = dt_util.utcnow()
+        store.fetched_at = self.fetched_at.timestamp()
+        store.workout_count = workout_count
+        store.async_schedule_save()
+        return workout_count
+
+    def _resync_window(self, workouts_data: dict[str, Any]) -> None:
+        """Replace the newest stored workouts with a freshly fetched page."""
+        store = self.config_entry.runtime_data.store
+        workouts = workouts_data.get("workouts", [])
+        store.replace_window(workouts, complete=len(workouts) < DEFAULT_WORKOUTS_COUNT)
+
+    async def _async_process_workouts(self, workout_count: int) -> dict[str, Any]:
+        """Process stored workouts into a more usable format."""
+        store = self.config_entry.runtime_data.store
+
+        async with self._index_lock:
+            await self._async_index_workouts(store)
+
+        newest = heapq.nlargest(
+            DEFAULT_WORKOUTS_COUNT,
+            self.workouts.values(),
+            key=lambda workout: workout.start_time,
+        )
+
+        data = {
+            "workout_count": workout_count,  # Use the dedicated workout_count endpoint
+            "workouts": {workout.id: workout for workout in newest},
+            "name": self.name,
+            **self.activity.counts(dt_util.now().date()),
+            **self.training_load.values(dt_util.now().date()),
+        }
+        with self._stage("analytics"):
+            data.update(await self._async_training_analytics(dt_util.now()))
+        self._update_fingerprints(data)
+        return data
+
+    async def _async_index_workouts(self, store: HevyWorkoutStore) -> None:
+        """
+        Model and index the workouts that are new or changed since the last update.
+
+        A cold index over a long history takes seconds, so it yields to the
+        event loop between batches. The store is iterated over a copy, since
+        a backfill may merge pages into it meanwhile.
+        """
+        self.modeled_workouts = 0
+        for workout_id in self.workouts.keys() - store.workouts.keys():
+            del self.workouts[workout_id]
+            del self._workout_sources[workout_id]
+            self.activity.remove(workout_id)
+            self.training_load.remove(workout_id)
+            self.sets.remove(workout_id)
+            self.statistics.remove(workout_id)
+            self.records.remove(workout_id)
+            self.count_coordinator.scheduler.remove(workout_id)
+        for workout_id, workout_data in list(store.workouts.items()):
+            if self._workout_sources.get(workout_id) is not workout_data:
+                workout = Workout.from_api(workout_data)
+                self.modeled_workouts += 1
+                self.workouts[workout_id] = workout
+                self._workout_sources[workout_id] = workout_data
+                self.activity.add(workout_id, workout.start_time)
+                self.training_load.add(workout)
+                self.sets.add(workout)
+                self.statistics.add(workout)
+                self.records.add(workout, store)
+                self.count_coordinator.scheduler.add(workout_id, workout.start_time)
+                if not self.modeled_workouts % PROCESS_BATCH_SIZE:
+                    await asyncio.sleep(0)
+
+    async def async_restore_store(self) -> None:
+        """
+        Index the stored workouts and publish them until the next refresh.
+
+        Indexing yields between batches, so a long history does not block the
+        event loop while the entry is set up.
+        """
+        store = self.config_entry.runtime_data.store
+        self.async_restore(
+            await self._async_process_workouts(store.workout_count), store.fetched_at
+        )
+
+    async def _async_training_analytics(self, now: datetime) -> dict[str, Any]:
+        """
+        Return the training analytics over every indexed set.
+
+        They are only run again once the set table or the local day changed.
+        The columns are copied in the event loop, where the table changes, and
+        reduced in the executor.
+        """
+        key = (self.sets.revision, dt_util.as_local(now).date())
+        if key != self._analytics_key:
+            self._analytics = await self.hass.async_add_executor_job(
+                training_analytics,
+                self.sets.columns(),
+                list(self.sets.exercise_titles),
+                now,
+            )
+            self._analytics_key = key
+        return self._analytics
+
+    def _update_fingerprints(self, data: dict[str, Any]) -> None:
+        """Fingerprint each slice of the data that entities read."""
+        self.fingerprints = {
+            workout_id: hash(workout)
+            for workout_id, workout in data["workouts"].items()
+        }
+        self.fingerprints[FINGERPRINT_SUMMARY] = hash(
+            json_bytes({key: value for key, value in data.items() if key != "workouts"})
+        )
+
+    @property
+    def diagnostics(self) -> dict[str, Any]:
+        """Return the update state and stage timings for diagnostics."""
+        return {
+            **super().diagnostics,
+            "stage_timings": self.stage_timings,
+            "modeled_workouts": self.modeled_workouts,
+            "indexed_workouts": len(self.workouts),
+            "record_exercises": len(self.records.exercises),
+            "set_rows": len(self.sets),
+            "set_table_bytes": self.sets.nbytes,
+            "backfill_running": (
+                self._backfill_task is not None and not self._backfill_task.done()
+            ),
+        }
+
+    async def async_handle_midnight(self, now: datetime) -> None:
+        """Roll the period counts over to the new local day."""
+        if not self.data:
+            return
+        analytics = await self._async_training_analytics(now)
+        self.data = {
+            **self.data,
+            **self.activity.counts(dt_util.as_local(now).date()),
+            **self.training_load.values(dt_util.as_local(now).date()),
+            **analytics,
+        }
+        self._update_fingerprints(self.data)
+        self.async_update_listeners()
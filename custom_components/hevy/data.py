@@ -10,7 +10,8 @@ if TYPE_CHECKING:
     from homeassistant.loader import Integration
 
     from .api import HevyApiClient
-    from .coordinator import HevyDataUpdateCoordinator
+    from .coordinator import HevyDataUpdateCoordinator, HevyWorkoutCountCoordinator
+    from .store import HevyWorkoutStore
 
 
 type HevyConfigEntry = ConfigEntry[HevyData]
@@ -22,4 +23,6 @@ class HevyData:
 
     client: HevyApiClient
     coordinator: HevyDataUpdateCoordinator
+    count_coordinator: HevyWorkoutCountCoordinator
     integration: Integration
+    store: HevyWorkoutStore
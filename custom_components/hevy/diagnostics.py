@@ -0,0 +1,39 @@
+"""Diagnostics support for hevy."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+
+from .const import CONF_AUTH_TOKEN, CONF_USERNAME, CONF_X_API_KEY
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .data import HevyConfigEntry
+
+TO_REDACT = {CONF_AUTH_TOKEN, CONF_USERNAME, CONF_X_API_KEY}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    entry: HevyConfigEntry,
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    runtime_data = entry.runtime_data
+    store = runtime_data.store
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "client": runtime_data.client.diagnostics,
+        "count_coordinator": runtime_data.count_coordinator.diagnostics,
+        "coordinator": runtime_data.coordinator.diagnostics,
+        "store": {
+            "workout_count": store.workout_count,
+            "stored_workouts": len(store.workouts),
+            "covered": store.covered,
+        },
+    }
@@ -2,23 +2,69 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
 
-from .const import ATTRIBUTION, DOMAIN
-from .coordinator import HevyDataUpdateCoordinator
+from .const import ATTRIBUTION, DOMAIN, FINGERPRINT_SUMMARY
+from .coordinator import HevyCoordinator, HevyDataUpdateCoordinator
 
+if TYPE_CHECKING:
+    from datetime import datetime
 
-class HevyEntity(CoordinatorEntity[HevyDataUpdateCoordinator]):
+    from .models import Workout
+
+
+class HevyCoordinatorEntity(CoordinatorEntity[HevyCoordinator]):
+    """Coordinator entity that only writes state when its data changed."""
+
+    _fingerprint_key: str
+    _written_fingerprint: tuple[bool, datetime | None, int | None] | None = None
+
+    def _fingerprint(self) -> tuple[bool, datetime | None, int | None]:
+        """Return the fingerprint of the data this entity shows."""
+        return (
+            self.coordinator.last_update_success,
+            self.coordinator.stale_since,
+            self.coordinator.fingerprints.get(self._fingerprint_key),
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return when the data went stale while the API is unreachable."""
+        if (stale_since := self.coordinator.stale_since) is None:
+            return None
+        return {"stale_since": stale_since.isoformat()}
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        self._written_fingerprint = self._fingerprint()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the entity's slice of the data changed."""
+        fingerprint = self._fingerprint()
+        if fingerprint == self._written_fingerprint:
+            self.coordinator.suppressed_writes += 1
+            return
+        self._written_fingerprint = fingerprint
+        self.coordinator.state_writes += 1
+        self.async_write_ha_state()
+
+
+class HevyEntity(HevyCoordinatorEntity):
     """HevyEntity class."""
 
+    _fingerprint_key = FINGERPRINT_SUMMARY
+
     _attr_attribution = ATTRIBUTION
     _attr_has_entity_name = True  # Use the device name as the entity name prefix
 
-    def __init__(self, coordinator: HevyDataUpdateCoordinator) -> None:
+    def __init__(self, coordinator: HevyCoordinator) -> None:
         """Initialize."""
         super().__init__(coordinator)
         name = coordinator.name
@@ -35,7 +81,7 @@ class HevyEntity(CoordinatorEntity[HevyDataUpdateCoordinator]):
         )
 
 
-class HevyWorkoutEntity(CoordinatorEntity[HevyDataUpdateCoordinator]):
+class HevyWorkoutEntity(HevyCoordinatorEntity):
     """Hevy Workout entity class."""
 
     _attr_attribution = ATTRIBUTION
@@ -49,24 +95,19 @@ class HevyWorkoutEntity(CoordinatorEntity[HevyDataUpdateCoordinator]):
         """Initialize the workout entity."""
         super().__init__(coordinator)
         self._workout_id = workout_id
+        self._fingerprint_key = workout_id
         self._attr_device_info = self._get_device_info()
 
     def _get_device_info(self) -> DeviceInfo:
         """Get device info for this workout."""
         name = self.coordinator.name
-        workout_data = self.coordinator.data.get("workouts", {}).get(
-            self._workout_id, {}
-        )
-        workout_title = workout_data.get("title", "Unknown Workout")
-        workout_date = (
-            workout_data.get("start_time", "").strftime("%Y-%m-%d")
-            if workout_data.get("start_time")
-            else ""
-        )
+        workout = self.workout
+        workout_title = workout.title if workout else "Unknown Workout"
+        workout_date = workout.start_time.strftime("%Y-%m-%d") if workout else ""
 
         return DeviceInfo(
             identifiers={(DOMAIN, f"{name}_{self._workout_id}")},
-            name=f"{name} Hevy Workout: {workout_title} ({workout_date})",
+            name=f"{name} {workout_title} {workout_date}",
             manufacturer="Hevy",
             model="Workout",
             via_device=(DOMAIN, f"{name}_{self.coordinator.config_entry.entry_id}"),
@@ -81,9 +122,9 @@ class HevyWorkoutEntity(CoordinatorEntity[HevyDataUpdateCoordinator]):
         return self._workout_id in self.coordinator.data.get("workouts", {})
 
     @property
-    def workout_data(self) -> dict[str, Any]:
-        """Return the workout data."""
-        return self.coordinator.data.get("workouts", {}).get(self._workout_id, {})
+    def workout(self) -> Workout | None:
+        """Return the workout."""
+        return self.coordinator.data.get("workouts", {}).get(self._workout_id)
 
 
 class HevyWorkoutDateSensor(HevyWorkoutEntity, SensorEntity):
@@ -0,0 +1,124 @@
+"""Request metrics for hevy."""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Any
+
+from .const import LATENCY_BUCKETS
+
+
+def elapsed_ms(started: float) -> float:
+    """Return the milliseconds elapsed since ``started``."""
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+class LatencyHistogram:
+    """Latencies counted in fixed millisecond buckets."""
+
+    def __init__(self, buckets: tuple[int, ...] = LATENCY_BUCKETS) -> None:
+        """Initialize the histogram."""
+        self._buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, latency_ms: float) -> None:
+        """Count a latency."""
+        self._counts[bisect_left(self._buckets, latency_ms)] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        self.max_ms = max(self.max_ms, latency_ms)
+
+    @property
+    def mean_ms(self) -> float | None:
+        """Return the mean latency."""
+        return round(self.total_ms / self.count, 1) if self.count else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram for diagnostics."""
+        labels = [f"<={bucket}ms" for bucket in self._buckets]
+        labels.append(f">{self._buckets[-1]}ms")
+        return {
+            "count": self.count,
+            "mean_ms": self.mean_ms,
+            "max_ms": self.max_ms,
+            "buckets": dict(zip(labels, self._counts, strict=True)),
+        }
+
+
+@dataclass(slots=True)
+class EndpointMetrics:
+    """Counters of the requests sent to one endpoint."""
+
+    requests: int = 0
+    errors: int = 0
+    not_modified: int = 0
+    bytes_total: int = 0
+    bytes_max: int = 0
+    decode_ms: float = 0.0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def record_response(self, started: float, size: int) -> None:
+        """Record a response with a body of ``size`` bytes."""
+        self.requests += 1
+        self.bytes_total += size
+        self.bytes_max = max(self.bytes_max, size)
+        self.latency.add(elapsed_ms(started))
+
+    def record_not_modified(self, started: float) -> None:
+        """Record a response revalidating a cached body."""
+        self.requests += 1
+        self.not_modified += 1
+        self.latency.add(elapsed_ms(started))
+
+    def record_error(self, started: float) -> None:
+        """Record a failed request."""
+        self.requests += 1
+        self.errors += 1
+        self.latency.add(elapsed_ms(started))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters for diagnostics."""
+        responses = self.requests - self.errors - self.not_modified
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "not_modified": self.not_modified,
+            "bytes_total": self.bytes_total,
+            "bytes_mean": self.bytes_total // responses if responses else None,
+            "bytes_max": self.bytes_max,
+            "decode_ms": round(self.decode_ms, 1),
+            "latency": self.latency.as_dict(),
+        }
+
+
+class ClientMetrics:
+    """Request metrics of an API client, per endpoint."""
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.endpoints: dict[str, EndpointMetrics] = {}
+
+    def endpoint(self, url: str) -> EndpointMetrics:
+        """Return the metrics of the endpoint a URL points to."""
+        name = url.rsplit("/", 1)[-1]
+        if (metrics := self.endpoints.get(name)) is None:
+            metrics = self.endpoints[name] = EndpointMetrics()
+        return metrics
+
+    @property
+    def mean_latency_ms(self) -> float | None:
+        """Return the mean latency over every endpoint."""
+        count = sum(metrics.latency.count for metrics in self.endpoints.values())
+        if not count:
+            return None
+        total = sum(metrics.latency.total_ms for metrics in self.endpoints.values())
+        return round(total / count, 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics for diagnostics."""
+        return {name: metrics.as_dict() for name, metrics in self.endpoints.items()}
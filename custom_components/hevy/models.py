@@ -0,0 +1,100 @@
+"""Workout models for hevy."""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+
+def _intern(value: str | None) -> str | None:
+    """Intern strings that repeat across workouts."""
+    return sys.intern(value) if value is not None else None
+
+
+@dataclass(slots=True, frozen=True)
+class ExerciseSet:
+    """A single set of an exercise."""
+
+    index: int
+    set_type: str
+    weight_kg: float | None
+    reps: int | None
+    rpe: float | None
+    duration_seconds: int | None
+    distance_meters: float | None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any], index: int) -> ExerciseSet:
+        """Create a set from the API representation."""
+        return cls(
+            index=data.get("index", index),
+            set_type=_intern(data.get("indicator") or data.get("type") or "normal"),
+            weight_kg=data.get("weight_kg"),
+            reps=data.get("reps"),
+            rpe=data.get("rpe"),
+            duration_seconds=data.get("duration_seconds"),
+            distance_meters=data.get("distance_meters"),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class Exercise:
+    """An exercise performed in a workout."""
+
+    id: str
+    template_id: str | None
+    title: str
+    sets: tuple[ExerciseSet, ...]
+    total_reps: int
+    max_weight_kg: float
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Exercise:
+        """Create an exercise from the API representation."""
+        sets = tuple(
+            ExerciseSet.from_api(set_data, index)
+            for index, set_data in enumerate(data["sets"])
+        )
+        return cls(
+            id=data["id"],
+            template_id=_intern(data.get("exercise_template_id")),
+            title=_intern(data["title"]),
+            sets=sets,
+            total_reps=sum(s.reps for s in sets if s.reps is not None),
+            max_weight_kg=max(
+                (s.weight_kg for s in sets if s.weight_kg is not None), default=0
+            ),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class Workout:
+    """A workout with its exercises."""
+
+    id: str
+    title: str
+    start_time: datetime
+    estimated_volume_kg: float
+    exercises: tuple[Exercise, ...]
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Workout:
+        """Create a workout from the API representation."""
+        return cls(
+            id=data["id"],
+            title=data["name"],
+            start_time=datetime.fromtimestamp(data["start_time"], tz=UTC),
+            estimated_volume_kg=data.get("estimated_volume_kg") or 0,
+            exercises=tuple(
+                Exercise.from_api(exercise) for exercise in data["exercises"]
+            ),
+        )
+
+    def exercise(self, exercise_id: str) -> Exercise | None:
+        """Return the exercise with the given id."""
+        for exercise in self.exercises:
+            if exercise.id == exercise_id:
+                return exercise
+        return None
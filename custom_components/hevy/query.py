@@ -0,0 +1,171 @@
+"""Range queries over the in-memory workout history for hevy."""
+
+from __future__ import annotations
+
+import math
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from homeassistant.util import dt as dt_util
+
+from .analytics import as_numpy, weekly_volume
+from .set_table import MISSING
+from .training_load import workout_volume
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from .coordinator import HevyDataUpdateCoordinator
+
+QUERY_WORKOUTS = "workouts"
+QUERY_SETS = "sets"
+QUERY_WEEKLY_VOLUME = "weekly_volume"
+
+
+def _page(items: list[Any], total: int, offset: int, limit: int) -> dict[str, Any]:
+    """Return a page of results with what is needed to fetch the next one."""
+    return {
+        "total": total,
+        "offset": offset,
+        "next_offset": offset + limit if offset + limit < total else None,
+        "items": items,
+    }
+
+
+def query_workouts(
+    coordinator: HevyDataUpdateCoordinator,
+    start: datetime | None,
+    end: datetime | None,
+    offset: int,
+    limit: int,
+) -> dict[str, Any]:
+    """Return the workouts started in the range, newest first."""
+    workout_ids, _ = coordinator.sets.workouts(start, end)
+    total = len(workout_ids)
+    # Newest first, so the page is counted from the end of the sorted ids
+    page = workout_ids[max(total - offset - limit, 0) : max(total - offset, 0)]
+    items = []
+    for workout_id in reversed(page):
+        workout = coordinator.workouts[workout_id]
+        items.append(
+            {
+                "id": workout.id,
+                "title": workout.title,
+                "start_time": workout.start_time.isoformat(),
+                "volume_kg": round(workout_volume(workout), 1),
+                "exercises": [
+                    {
+                        "title": exercise.title,
+                        "sets": len(exercise.sets),
+                        "total_reps": exercise.total_reps,
+                        "max_weight_kg": exercise.max_weight_kg,
+                    }
+                    for exercise in workout.exercises
+                ],
+            }
+        )
+    return _page(items, total, offset, limit)
+
+
+def query_sets(  # noqa: PLR0913
+    coordinator: HevyDataUpdateCoordinator,
+    exercise: str,
+    start: datetime | None,
+    end: datetime | None,
+    offset: int,
+    limit: int,
+) -> dict[str, Any] | None:
+    """
+    Return the sets of an exercise in the range, newest workout first.
+
+    The exercise is matched by template id or, ignoring case, by title.
+    Returns None if no indexed workout has the exercise.
+    """
+    table = coordinator.sets
+    wanted = exercise.casefold()
+    codes = [
+        code
+        for code, (key, title) in enumerate(
+            zip(table.exercise_keys, table.exercise_titles, strict=True)
+        )
+        if key == exercise or title.casefold() == wanted
+    ]
+    if not codes:
+        return None
+
+    columns = table.columns(start, end)
+    rows = np.flatnonzero(np.isin(as_numpy(columns.exercise), codes))
+    # A stable sort keeps the sets of a workout in their order
+    rows = rows[np.argsort(-as_numpy(columns.start_time)[rows], kind="stable")]
+    page = rows[offset : offset + limit].tolist()
+    items = [
+        {
+            "start_time": dt_util.utc_from_timestamp(
+                columns.start_time[row]
+            ).isoformat(),
+            "workout_id": table.workout_ids[columns.workout[row]],
+            "exercise": table.exercise_titles[columns.exercise[row]],
+            "index": columns.set_index[row],
+            "type": table.set_types[columns.set_type[row]],
+            "weight_kg": _float(columns.weight_kg[row]),
+            "reps": _int(columns.reps[row]),
+            "rpe": _float(columns.rpe[row]),
+            "duration_seconds": _int(columns.duration_seconds[row]),
+            "distance_meters": _float(columns.distance_meters[row]),
+        }
+        for row in page
+    ]
+    return _page(items, len(rows), offset, limit)
+
+
+def query_weekly_volume(
+    coordinator: HevyDataUpdateCoordinator,
+    start: datetime | None,
+    end: datetime | None,
+    offset: int,
+    limit: int,
+) -> dict[str, Any]:
+    """
+    Return the volume, sets and workouts of each week, newest first.
+
+    Weeks start on Monday in the local time zone and are always whole, so the
+    first and last week may cover sets outside the range.
+    """
+    table = coordinator.sets
+    workout_ids, workout_times = table.workouts(start, end)
+    if not workout_ids:
+        return _page([], 0, offset, limit)
+
+    first = dt_util.as_local(dt_util.utc_from_timestamp(workout_times[0])).date()
+    last = dt_util.as_local(dt_util.utc_from_timestamp(workout_times[-1])).date()
+    monday = first - timedelta(days=first.weekday())
+    weeks = [
+        monday + timedelta(weeks=week) for week in range((last - monday).days // 7 + 1)
+    ]
+    edges = [dt_util.start_of_local_day(week) for week in weeks]
+    edges.append(dt_util.start_of_local_day(weeks[-1] + timedelta(weeks=1)))
+
+    _, all_workout_times = table.workouts()
+    totals = weekly_volume(
+        table.columns(edges[0], edges[-1]),
+        all_workout_times,
+        [edge.timestamp() for edge in edges],
+    )
+    total = len(weeks)
+    items = [
+        {"week": week.isoformat(), "volume_kg": volume, "sets": sets, "workouts": count}
+        for week, (volume, sets, count) in zip(weeks, totals, strict=True)
+    ]
+    items.reverse()
+    return _page(items[offset : offset + limit], total, offset, limit)
+
+
+def _float(value: float) -> float | None:
+    """Return a float column value, None when it is missing."""
+    return None if math.isnan(value) else round(value, 2)
+
+
+def _int(value: int) -> int | None:
+    """Return an integer column value, None when it is missing."""
+    return None if value == MISSING else value
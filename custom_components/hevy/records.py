@@ -0,0 +1,262 @@
+"""Personal record index for hevy."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+
+from .const import E1RM_MAX_REPS, EVENT_PERSONAL_RECORD, LOGGER
+
+if TYPE_CHECKING:
+    from collections.abc import Container
+
+    from homeassistant.core import HomeAssistant
+
+    from .models import Exercise, Workout
+    from .store import HevyWorkoutStore
+
+RECORD_WEIGHT = "weight"
+RECORD_ESTIMATED_1RM = "estimated_1rm"
+RECORD_SET_VOLUME = "set_volume"
+RECORD_REPS = "reps"
+
+
+def estimated_1rm(weight_kg: float, reps: int) -> float | None:
+    """Return the one rep max estimated with the Epley formula."""
+    if reps < 1 or reps > E1RM_MAX_REPS:
+        return None
+    if reps == 1:
+        return weight_kg
+    return round(weight_kg * (1 + reps / 30), 2)
+
+
+@dataclass(slots=True)
+class Record:
+    """A record value and the workout that set it."""
+
+    value: float
+    workout_id: str
+    achieved: float  # timestamp
+
+    def as_compact(self) -> list[Any]:
+        """Return a compact, JSON serializable representation."""
+        return [self.value, self.workout_id, self.achieved]
+
+
+@dataclass(slots=True)
+class ExerciseRecords:
+    """Best performances of one exercise over the whole history."""
+
+    title: str
+    best: dict[str, Record] = field(default_factory=dict)
+    # Most reps done with each weight, keyed by the formatted weight
+    reps: dict[str, Record] = field(default_factory=dict)
+
+    @classmethod
+    def from_compact(cls, data: list[Any]) -> ExerciseRecords:
+        """Create records from their compact representation."""
+        title, best, reps = data
+        return cls(
+            title=title,
+            best={key: Record(*record) for key, record in best.items()},
+            reps={key: Record(*record) for key, record in reps.items()},
+        )
+
+    def as_compact(self) -> list[Any]:
+        """Return a compact, JSON serializable representation."""
+        return [
+            self.title,
+            {key: record.as_compact() for key, record in self.best.items()},
+            {key: record.as_compact() for key, record in self.reps.items()},
+        ]
+
+    def held_by(self, workout_ids: Container[str]) -> bool:
+        """Return whether any of the records was set by one of the workouts."""
+        return any(
+            record.workout_id in workout_ids
+            for records in (self.best, self.reps)
+            for record in records.values()
+        )
+
+    def add(self, workout: Workout, exercise: Exercise) -> list[dict[str, Any]]:
+        """Add the sets of an exercise, returning the records they broke."""
+        broken: dict[tuple[str, str], dict[str, Any]] = {}
+        achieved = workout.start_time.timestamp()
+        for exercise_set in exercise.sets:
+            weight_kg = exercise_set.weight_kg
+            reps = exercise_set.reps
+            if not weight_kg or weight_kg <= 0:
+                continue
+            candidates = [(RECORD_WEIGHT, self.best, RECORD_WEIGHT, weight_kg)]
+            if reps:
+                candidates.append((RECORD_REPS, self.reps, f"{weight_kg:g}", reps))
+                candidates.append(
+                    (RECORD_SET_VOLUME, self.best, RECORD_SET_VOLUME, weight_kg * reps)
+                )
+                if (one_rep_max := estimated_1rm(weight_kg, reps)) is not None:
+                    candidates.append(
+                        (
+                            RECORD_ESTIMATED_1RM,
+                            self.best,
+                            RECORD_ESTIMATED_1RM,
+                            one_rep_max,
+                        )
+                    )
+            for record, records, key, value in candidates:
+                previous = records.get(key)
+                if previous is not None and value <= previous.value:
+                    continue
+                records[key] = Record(value, workout.id, achieved)
+                # Later sets of the workout may break the same record again
+                if (record, key) not in broken:
+                    broken[record, key] = {
+                        "record": record,
+                        "previous": previous.value if previous else None,
+                    }
+                broken[record, key].update(value=value, weight_kg=weight_kg, reps=reps)
+        return list(broken.values())
+
+
+class PersonalRecords:
+    """
+    Personal records per exercise template, updated from new sets only.
+
+    The records are persisted with the workout store, so a poll only scans the
+    sets of new or changed workouts. Records broken by a workout newer than
+    every workout indexed before are announced with an event; records that come
+    from the initial index or from backfilled history are taken silently.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, name: str) -> None:
+        """Initialize the index."""
+        self._hass = hass
+        self._entry_id = entry_id
+        self._name = name
+        self.exercises: dict[str, ExerciseRecords] = {}
+        # Start time of the newest indexed workout, None until the first commit
+        self._newest: float | None = None
+        self._pending_newest: float | None = None
+        self._loaded = False
+        self._reconciled = False
+        self._dirty = False
+        self._events: list[dict[str, Any]] = []
+        # Indexed workouts per exercise, to recompute the records a workout held
+        self._exercise_workouts: dict[str, dict[str, Workout]] = {}
+        self._workout_exercises: dict[str, set[str]] = {}
+
+    def add(self, workout: Workout, store: HevyWorkoutStore) -> None:
+        """Index a workout, replacing it if it was indexed before."""
+        if not self._loaded:
+            self._load(store)
+        self.remove(workout.id)
+        started = workout.start_time.timestamp()
+        notify = self._newest is not None and started > self._newest
+        if self._pending_newest is None or started > self._pending_newest:
+            self._pending_newest = started
+
+        keys = self._workout_exercises[workout.id] = set()
+        for exercise in workout.exercises:
+            key = exercise.template_id or exercise.title
+            keys.add(key)
+            self._exercise_workouts.setdefault(key, {})[workout.id] = workout
+            if (records := self.exercises.get(key)) is None:
+                records = self.exercises[key] = ExerciseRecords(exercise.title)
+            if not (broken := records.add(workout, exercise)):
+                continue
+            self._dirty = True
+            if notify:
+                # Records of an exercise done for the first time are not news
+                self._events.extend(
+                    {
+                        **record,
+                        "exercise_template_id": exercise.template_id,
+                        "exercise": exercise.title,
+                        "workout_id": workout.id,
+                        "workout": workout.title,
+                    }
+                    for record in broken
+                    if record["previous"] is not None
+                )
+
+    def remove(self, workout_id: str) -> None:
+        """Remove a workout, recomputing the records it held."""
+        for key in self._workout_exercises.pop(workout_id, ()):
+            del self._exercise_workouts[key][workout_id]
+            if self.exercises[key].held_by({workout_id}):
+                self._recompute(key)
+
+    @callback
+    def async_commit(self, store: HevyWorkoutStore) -> None:
+        """Persist the records and announce the ones that fell."""
+        if not self._loaded:
+            self._load(store)
+        if not self._reconciled:
+            # Every stored workout is indexed now, recompute the records of
+            # workouts deleted while they were not
+            self._reconciled = True
+            for key in list(self.exercises):
+                workouts = self._exercise_workouts.get(key, {})
+                if self.exercises[key].held_by(_Missing(workouts)):
+                    self._recompute(key)
+        if self._pending_newest is not None and (
+            self._newest is None or self._pending_newest > self._newest
+        ):
+            self._newest = self._pending_newest
+            self._dirty = True
+
+        for event in self._events:
+            LOGGER.debug("New personal record: %s", event)
+            self._hass.bus.async_fire(
+                EVENT_PERSONAL_RECORD,
+                {"entry_id": self._entry_id, "name": self._name, **event},
+            )
+        self._events.clear()
+
+        if not self._dirty:
+            return
+        self._dirty = False
+        store.records = {
+            "newest": self._newest,
+            "exercises": {
+                key: records.as_compact() for key, records in self.exercises.items()
+            },
+        }
+        store.async_schedule_save()
+
+    def _load(self, store: HevyWorkoutStore) -> None:
+        """Load the persisted records once."""
+        self._loaded = True
+        if not (data := store.records):
+            return
+        self._newest = data["newest"]
+        self.exercises = {
+            key: ExerciseRecords.from_compact(records)
+            for key, records in data["exercises"].items()
+        }
+
+    def _recompute(self, key: str) -> None:
+        """Recompute the records of an exercise from its indexed workouts."""
+        self._dirty = True
+        if not (workouts := self._exercise_workouts.get(key)):
+            self._exercise_workouts.pop(key, None)
+            self.exercises.pop(key, None)
+            return
+        records = self.exercises[key] = ExerciseRecords(self.exercises[key].title)
+        for workout in workouts.values():
+            for exercise in workout.exercises:
+                if (exercise.template_id or exercise.title) == key:
+                    records.add(workout, exercise)
+
+
+class _Missing:
+    """Container of every workout id except the given ones."""
+
+    def __init__(self, workouts: Container[str]) -> None:
+        """Initialize the container."""
+        self._workouts = workouts
+
+    def __contains__(self, workout_id: object) -> bool:
+        """Return whether a workout id is not one of the given ones."""
+        return workout_id not in self._workouts
@@ -0,0 +1,92 @@
+"""Adaptive polling scheduler for hevy."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from homeassistant.util import dt as dt_util
+
+from .const import ADAPTIVE_BOOST_DURATION, ADAPTIVE_LOOKBACK_HOURS
+
+HOURS_PER_WEEK = 7 * 24
+
+
+def _hour_of_week(moment: datetime) -> int:
+    """Return the local hour of the week, Monday 00:00 being 0."""
+    local = dt_util.as_local(moment)
+    return local.weekday() * 24 + local.hour
+
+
+class AdaptivePollScheduler:
+    """
+    Pick poll intervals from the hours of the week a user usually trains.
+
+    Workouts only show up once they are saved, so an hour counts as active
+    when workouts usually started in it or in the hours just before it.
+    """
+
+    def __init__(
+        self,
+        min_interval: timedelta,
+        max_interval: timedelta,
+        default_interval: timedelta,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.default_interval = default_interval
+        self._workout_hours: dict[str, int] = {}
+        self._hours = [0] * HOURS_PER_WEEK
+        self._changed_at: datetime | None = None
+
+    def add(self, workout_id: str, start_time: datetime) -> None:
+        """Learn from a workout, replacing it if it was seen before."""
+        self.remove(workout_id)
+        hour = _hour_of_week(start_time)
+        self._workout_hours[workout_id] = hour
+        self._hours[hour] += 1
+
+    def remove(self, workout_id: str) -> None:
+        """Forget a workout."""
+        if (hour := self._workout_hours.pop(workout_id, None)) is not None:
+            self._hours[hour] -= 1
+
+    def note_change(self, now: datetime) -> None:
+        """Record that the workout count just changed."""
+        self._changed_at = now
+
+    def _activity(self, hour: int) -> float:
+        """Return how active an hour of the week is, from 0 to 1."""
+        peak = max(self._hours)
+        if not peak:
+            return 0.0
+        return (
+            max(
+                self._hours[(hour - offset) % HOURS_PER_WEEK]
+                for offset in range(ADAPTIVE_LOOKBACK_HOURS + 1)
+            )
+            / peak
+        )
+
+    def next_interval(self, now: datetime) -> timedelta:
+        """Return how long to wait before the next poll."""
+        if self._changed_at is not None and now - self._changed_at < timedelta(
+            minutes=ADAPTIVE_BOOST_DURATION
+        ):
+            return self.min_interval
+        if not self._workout_hours:
+            return min(max(self.default_interval, self.min_interval), self.max_interval)
+
+        # Interpolate geometrically, so idle hours back off sharply
+        hour = _hour_of_week(now)
+        ratio = self.max_interval / self.min_interval
+        interval = self.min_interval * ratio ** (1 - self._activity(hour))
+
+        # Do not sleep through the start of an upcoming active hour
+        next_hour = dt_util.as_local(now).replace(minute=0, second=0, microsecond=0)
+        for offset in range(1, int(interval / timedelta(hours=1)) + 1):
+            if self._activity((hour + offset) % HOURS_PER_WEEK) >= 0.5:
+                interval = min(interval, next_hour + timedelta(hours=offset) - now)
+                break
+
+        return max(interval, self.min_interval)
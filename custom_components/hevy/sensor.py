@@ -11,7 +11,18 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.const import UnitOfMass
+from homeassistant.const import (
+    PERCENTAGE,
+    EntityCategory,
+    Platform,
+    UnitOfMass,
+    UnitOfTime,
+)
+from homeassistant.core import callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+
+from .const import DOMAIN, MAX_ATTRIBUTE_SETS
 
 from .entity import HevyEntity, HevyWorkoutEntity
 
@@ -21,8 +32,9 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-    from .coordinator import HevyDataUpdateCoordinator
+    from .coordinator import HevyCoordinator, HevyDataUpdateCoordinator
     from .data import HevyConfigEntry
+    from .models import Exercise, ExerciseSet, Workout
 
 
 @dataclass
@@ -38,6 +50,8 @@ class HevySensorEntityDescription(
 ):
     """Hevy sensor entity description."""
 
+    attributes_fn: callable[[dict[str, Any]], dict[str, Any]] | None = None
+
 
 WORKOUT_COUNT_DESCRIPTION: Final = HevySensorEntityDescription(
     key="workout_count",
@@ -80,59 +94,258 @@ YEAR_COUNT_DESCRIPTION: Final = HevySensorEntityDescription(
 )
 
 
+ANALYTICS_DESCRIPTIONS: Final = [
+    HevySensorEntityDescription(
+        key="week_tonnage",
+        translation_key="week_tonnage",
+        icon="mdi:weight",
+        device_class=SensorDeviceClass.WEIGHT,
+        native_unit_of_measurement=UnitOfMass.KILOGRAMS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data.get("week_tonnage"),
+    ),
+    HevySensorEntityDescription(
+        key="month_tonnage",
+        translation_key="month_tonnage",
+        icon="mdi:weight",
+        device_class=SensorDeviceClass.WEIGHT,
+        native_unit_of_measurement=UnitOfMass.KILOGRAMS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data.get("month_tonnage"),
+    ),
+    HevySensorEntityDescription(
+        key="four_week_tonnage",
+        translation_key="four_week_tonnage",
+        icon="mdi:weight",
+        device_class=SensorDeviceClass.WEIGHT,
+        native_unit_of_measurement=UnitOfMass.KILOGRAMS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data.get("four_week_tonnage"),
+    ),
+    HevySensorEntityDescription(
+        key="four_week_count",
+        translation_key="four_week_count",
+        icon="mdi:calendar-range",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data.get("four_week_count", 0),
+    ),
+    HevySensorEntityDescription(
+        key="week_streak",
+        translation_key="week_streak",
+        icon="mdi:fire",
+        native_unit_of_measurement=UnitOfTime.WEEKS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data.get("week_streak", 0),
+    ),
+    HevySensorEntityDescription(
+        key="acute_chronic_ratio",
+        translation_key="acute_chronic_ratio",
+        icon="mdi:scale-balance",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data.get("acute_chronic_ratio"),
+    ),
+    HevySensorEntityDescription(
+        key="training_intensity",
+        translation_key="training_intensity",
+        icon="mdi:speedometer",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data.get("training_intensity"),
+        attributes_fn=lambda data: {
+            "distribution": data.get("intensity_distribution", {})
+        },
+    ),
+    HevySensorEntityDescription(
+        key="volume_trend",
+        translation_key="volume_trend",
+        icon="mdi:trending-up",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data.get("volume_trend"),
+        attributes_fn=lambda data: {"exercises": data.get("exercise_trends", {})},
+    ),
+]
+
+
+@dataclass
+class HevyDiagnosticSensorEntityDescriptionRequired:
+    """Required properties for HevyDiagnosticSensorEntityDescription."""
+
+    value_fn: callable[[HevyDataUpdateCoordinator], Any]
+
+
+@dataclass
+class HevyDiagnosticSensorEntityDescription(
+    SensorEntityDescription, HevyDiagnosticSensorEntityDescriptionRequired
+):
+    """Hevy diagnostic sensor entity description."""
+
+    entity_category: EntityCategory | None = EntityCategory.DIAGNOSTIC
+    entity_registry_enabled_default: bool = False
+
+
+DIAGNOSTIC_DESCRIPTIONS: Final = [
+    HevyDiagnosticSensorEntityDescription(
+        key="update_duration",
+        translation_key="update_duration",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.stage_timings.get("total"),
+    ),
+    HevyDiagnosticSensorEntityDescription(
+        key="api_latency",
+        translation_key="api_latency",
+        icon="mdi:timer-sand",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: (
+            coordinator.config_entry.runtime_data.client.metrics.mean_latency_ms
+        ),
+    ),
+    HevyDiagnosticSensorEntityDescription(
+        key="cache_hit_rate",
+        translation_key="cache_hit_rate",
+        icon="mdi:cached",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: (
+            coordinator.config_entry.runtime_data.client.cache_hit_rate
+        ),
+    ),
+    # Running totals, a per update count read while the update is dispatched
+    # would miss the writes still to come
+    HevyDiagnosticSensorEntityDescription(
+        key="state_writes",
+        translation_key="state_writes",
+        icon="mdi:database-edit-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.state_writes,
+    ),
+    HevyDiagnosticSensorEntityDescription(
+        key="suppressed_writes",
+        translation_key="suppressed_writes",
+        icon="mdi:database-off-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.suppressed_writes,
+    ),
+]
+
+
 async def async_setup_entry(
-    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    hass: HomeAssistant,
     entry: HevyConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the sensor platform."""
     coordinator = entry.runtime_data.coordinator
 
-    # Add the primary workout count sensors
-    entities = [
+    # Add the primary workout count sensors, the total follows the cheap probe
+    entities: list[SensorEntity] = [
+        HevySensor(
+            coordinator=entry.runtime_data.count_coordinator,
+            entity_description=WORKOUT_COUNT_DESCRIPTION,
+        )
+    ]
+    entities.extend(
         HevySensor(
             coordinator=coordinator,
             entity_description=description,
         )
         for description in [
-            WORKOUT_COUNT_DESCRIPTION,
             TODAY_COUNT_DESCRIPTION,
             WEEK_COUNT_DESCRIPTION,
             MONTH_COUNT_DESCRIPTION,
             YEAR_COUNT_DESCRIPTION,
+            *ANALYTICS_DESCRIPTIONS,
         ]
-    ]
+    )
+    entities.extend(
+        HevyDiagnosticSensor(coordinator=coordinator, entity_description=description)
+        for description in DIAGNOSTIC_DESCRIPTIONS
+    )
+    async_add_entities(entities)
 
-    # Add entities for each workout's exercises
-    if coordinator.data and "workouts" in coordinator.data:
-        for workout_id, workout_data in coordinator.data["workouts"].items():
-            # Create a workout date sensor
-            entities.append(HevyWorkoutDateSensor(coordinator, workout_id))
-
-            # Create sensors for each exercise in the workout
-            for exercise_key, exercise_data in workout_data.get(
-                "exercises", {}
-            ).items():
-                entities.append(
-                    HevyExerciseSensor(
-                        coordinator=coordinator,
-                        workout_id=workout_id,
-                        exercise_key=exercise_key,
-                        exercise_data=exercise_data,
-                    )
-                )
+    known_workouts: set[str] = set()
+    known_exercises = coordinator.exercise_sensors
+
+    @callback
+    def _async_sync_workout_entities() -> None:
+        """Add entities for new workouts and remove the ones that fell out."""
+        workouts = (coordinator.data or {}).get("workouts", {})
+        exercises = {
+            f"{workout_id}_{exercise.id}": (workout_id, exercise.id)
+            for workout_id, workout in workouts.items()
+            for exercise in workout.exercises
+        }
 
-    async_add_entities(entities)
+        entities: list[SensorEntity] = [
+            HevyWorkoutDateSensor(coordinator, workout_id)
+            for workout_id in workouts.keys() - known_workouts
+        ]
+        entities.extend(
+            HevyExerciseSensor(
+                coordinator=coordinator,
+                workout_id=workout_id,
+                exercise=workouts[workout_id].exercise(exercise_id),
+            )
+            for unique_id, (workout_id, exercise_id) in exercises.items()
+            if unique_id not in known_exercises
+        )
+
+        entity_registry = er.async_get(hass)
+        for unique_id in known_exercises.keys() - exercises.keys():
+            if entity_id := entity_registry.async_get_entity_id(
+                Platform.SENSOR, DOMAIN, unique_id
+            ):
+                entity_registry.async_remove(entity_id)
+
+        if not known_workouts or workouts.keys() != known_workouts:
+            _async_remove_stale_devices(hass, entry, workouts)
+
+        known_workouts.clear()
+        known_workouts.update(workouts)
+        known_exercises.clear()
+        known_exercises.update(exercises)
+
+        if entities:
+            async_add_entities(entities)
+
+    _async_sync_workout_entities()
+    entry.async_on_unload(coordinator.async_add_listener(_async_sync_workout_entities))
+
+
+@callback
+def _async_remove_stale_devices(
+    hass: HomeAssistant,
+    entry: HevyConfigEntry,
+    workouts: dict[str, Workout],
+) -> None:
+    """Remove workout devices, and with them their entities, that fell out."""
+    name = entry.runtime_data.coordinator.name
+    current = {(DOMAIN, f"{name}_{workout_id}") for workout_id in workouts}
+    current.add((DOMAIN, f"{name}_{entry.entry_id}"))
+
+    device_registry = dr.async_get(hass)
+    for device in dr.async_entries_for_config_entry(device_registry, entry.entry_id):
+        if device.identifiers.isdisjoint(current):
+            device_registry.async_update_device(
+                device.id, remove_config_entry_id=entry.entry_id
+            )
 
 
 class HevySensor(HevyEntity, SensorEntity):
     """Hevy Sensor class."""
 
     entity_description: HevySensorEntityDescription
+    # Breakdowns for cards, the recorder keeps only the states
+    _unrecorded_attributes = frozenset({"distribution", "exercises"})
 
     def __init__(
         self,
-        coordinator: HevyDataUpdateCoordinator,
+        coordinator: HevyCoordinator,
         entity_description: HevySensorEntityDescription,
     ) -> None:
         """Initialize the sensor class."""
@@ -152,6 +365,41 @@ class HevySensor(HevyEntity, SensorEntity):
         """Return the native value of the sensor."""
         return self.entity_description.value_fn(self.coordinator.data)
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the breakdown of the value, if the sensor has one."""
+        attributes = super().extra_state_attributes
+        if (attributes_fn := self.entity_description.attributes_fn) is None:
+            return attributes
+        return {**(attributes or {}), **attributes_fn(self.coordinator.data)}
+
+
+class HevyDiagnosticSensor(HevyEntity, SensorEntity):
+    """Sensor showing how the integration itself performs."""
+
+    entity_description: HevyDiagnosticSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: HevyDataUpdateCoordinator,
+        entity_description: HevyDiagnosticSensorEntityDescription,
+    ) -> None:
+        """Initialize the diagnostic sensor."""
+        super().__init__(coordinator)
+        self.entity_description = entity_description
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.entry_id}_{entity_description.key}"
+        )
+
+    def _fingerprint(self) -> tuple[Any, ...]:
+        """Include the value, which changes without the coordinator data."""
+        return (*super()._fingerprint(), self.native_value)
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the native value of the sensor."""
+        return self.entity_description.value_fn(self.coordinator)
+
 
 class HevyWorkoutDateSensor(HevyWorkoutEntity, SensorEntity):
     """Sensor showing the workout date."""
@@ -173,61 +421,78 @@ class HevyWorkoutDateSensor(HevyWorkoutEntity, SensorEntity):
     @property
     def native_value(self) -> datetime | None:
         """Return the native value of the sensor."""
-        workout_data = self.workout_data
-        return workout_data.get("start_time") if workout_data else None
+        workout = self.workout
+        return workout.start_time if workout else None
 
 
 class HevyExerciseSensor(HevyWorkoutEntity, SensorEntity):
     """Sensor showing exercise data."""
 
+    # The set summary is for cards, the recorder keeps only the totals
+    _unrecorded_attributes = frozenset({"set_summary"})
+
     def __init__(
         self,
         coordinator: HevyDataUpdateCoordinator,
         workout_id: str,
-        exercise_key: str,
-        exercise_data: dict[str, Any],
+        exercise: Exercise,
     ) -> None:
         """Initialize the exercise sensor."""
         super().__init__(coordinator, workout_id)
-        self._exercise_key = exercise_key
-        self._exercise_data = exercise_data
-
-        exercise_title = exercise_data.get("title", "Unknown Exercise")
+        self._exercise_key = exercise.id
 
         # Use a more streamlined unique_id and better naming
-        self._attr_unique_id = f"{workout_id}_{exercise_key}"
-        self._attr_name = exercise_title  # Use just the exercise title as name
+        self._attr_unique_id = f"{workout_id}_{exercise.id}"
+        self._attr_name = exercise.title  # Use just the exercise title as name
 
         # Use weight as the primary value if available
-        if exercise_data.get("max_weight_kg", 0) > 0:
+        if exercise.max_weight_kg > 0:
             self._attr_native_unit_of_measurement = UnitOfMass.KILOGRAMS
             self._attr_state_class = SensorStateClass.MEASUREMENT
 
+    @property
+    def exercise(self) -> Exercise | None:
+        """Return the exercise."""
+        workout = self.workout
+        return workout.exercise(self._exercise_key) if workout else None
+
     @property
     def native_value(self) -> float | None:
         """Return the weight of the exercise."""
         if not self.available:
             return None
 
-        if not self.workout_data:
-            return None
-
-        exercise_data = self.workout_data.get("exercises", {}).get(self._exercise_key)
-        if not exercise_data:
-            return None
-
-        return exercise_data.get("max_weight_kg")
+        exercise = self.exercise
+        return exercise.max_weight_kg if exercise else None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes about the exercise."""
-        if not self.available or not self.workout_data:
+        if not self.available or (exercise := self.exercise) is None:
             return {}
 
-        exercise_data = self.workout_data.get("exercises", {}).get(
-            self._exercise_key, {}
-        )
         return {
-            "sets": exercise_data.get("sets", 0),
-            "total_reps": exercise_data.get("total_reps", 0),
+            **(super().extra_state_attributes or {}),
+            "sets": len(exercise.sets),
+            "total_reps": exercise.total_reps,
+            "set_summary": _set_summary(exercise.sets),
         }
+
+
+def _set_summary(sets: tuple[ExerciseSet, ...]) -> str:
+    """Return a short summary of the first sets, like ``100 kg x 5``."""
+    parts = []
+    for exercise_set in sets[:MAX_ATTRIBUTE_SETS]:
+        part = []
+        if exercise_set.weight_kg is not None:
+            part.append(f"{exercise_set.weight_kg:g} kg")
+        if exercise_set.reps is not None:
+            part.append(f"x {exercise_set.reps}")
+        elif exercise_set.duration_seconds is not None:
+            part.append(f"{exercise_set.duration_seconds} s")
+        elif exercise_set.distance_meters is not None:
+            part.append(f"{exercise_set.distance_meters:g} m")
+        parts.append(" ".join(part) or exercise_set.set_type)
+    if len(sets) > MAX_ATTRIBUTE_SETS:
+        parts.append(f"+{len(sets) - MAX_ATTRIBUTE_SETS} more")
+    return ", ".join(parts)
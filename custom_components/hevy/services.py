@@ -0,0 +1,189 @@
+"""Services for hevy."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_CONFIG_ENTRY_ID,
+    DEFAULT_QUERY_LIMIT,
+    DOMAIN,
+    MAX_QUERY_LIMIT,
+    SERVICE_GET_EXERCISE_SETS,
+    SERVICE_QUERY_WORKOUTS,
+)
+from .query import (
+    QUERY_SETS,
+    QUERY_WEEKLY_VOLUME,
+    QUERY_WORKOUTS,
+    query_sets,
+    query_weekly_volume,
+    query_workouts,
+)
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from .data import HevyConfigEntry
+    from .models import ExerciseSet
+
+ATTR_DAYS = "days"
+ATTR_END = "end"
+ATTR_EXERCISE = "exercise"
+ATTR_LIMIT = "limit"
+ATTR_OFFSET = "offset"
+ATTR_QUERY = "query"
+ATTR_START = "start"
+
+GET_EXERCISE_SETS_SCHEMA = vol.Schema({vol.Required(ATTR_ENTITY_ID): cv.entity_id})
+
+QUERY_WORKOUTS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_QUERY, default=QUERY_WORKOUTS): vol.In(
+            [QUERY_WORKOUTS, QUERY_SETS, QUERY_WEEKLY_VOLUME]
+        ),
+        vol.Exclusive(ATTR_START, "range_start"): cv.datetime,
+        vol.Exclusive(ATTR_DAYS, "range_start"): cv.positive_int,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_EXERCISE): cv.string,
+        vol.Optional(ATTR_OFFSET, default=0): vol.All(
+            vol.Coerce(int), vol.Range(min=0)
+        ),
+        vol.Optional(ATTR_LIMIT, default=DEFAULT_QUERY_LIMIT): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_QUERY_LIMIT)
+        ),
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+
+    @callback
+    def _async_get_exercise_sets(call: ServiceCall) -> ServiceResponse:
+        """Return every set of the exercise an exercise sensor shows."""
+        entity_id = call.data[ATTR_ENTITY_ID]
+        entity = er.async_get(hass).async_get(entity_id)
+        if entity is None or entity.platform != DOMAIN:
+            msg = f"{entity_id} is not a Hevy entity"
+            raise ServiceValidationError(msg)
+        coordinator = _loaded_entry(
+            hass, entity.config_entry_id
+        ).runtime_data.coordinator
+        ids = coordinator.exercise_sensors.get(entity.unique_id)
+        workout = coordinator.workouts.get(ids[0]) if ids else None
+        if (exercise := workout.exercise(ids[1]) if workout else None) is None:
+            msg = f"{entity_id} is not an exercise sensor"
+            raise ServiceValidationError(msg)
+        return {
+            "workout_id": workout.id,
+            "workout": workout.title,
+            "start_time": workout.start_time.isoformat(),
+            "exercise": exercise.title,
+            "sets": [_set_as_dict(exercise_set) for exercise_set in exercise.sets],
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_EXERCISE_SETS,
+        _async_get_exercise_sets,
+        schema=GET_EXERCISE_SETS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    @callback
+    def _async_query_workouts(call: ServiceCall) -> ServiceResponse:
+        """Answer a range query from the workout history held in memory."""
+        coordinator = _loaded_entry(
+            hass, call.data.get(ATTR_CONFIG_ENTRY_ID)
+        ).runtime_data.coordinator
+        end = _aware(call.data.get(ATTR_END))
+        if (days := call.data.get(ATTR_DAYS)) is not None:
+            start = (end or dt_util.now()) - timedelta(days=days)
+        else:
+            start = _aware(call.data.get(ATTR_START))
+        offset = call.data[ATTR_OFFSET]
+        limit = call.data[ATTR_LIMIT]
+
+        query = call.data[ATTR_QUERY]
+        if query == QUERY_WEEKLY_VOLUME:
+            return query_weekly_volume(coordinator, start, end, offset, limit)
+        if query == QUERY_WORKOUTS:
+            return query_workouts(coordinator, start, end, offset, limit)
+        if (exercise := call.data.get(ATTR_EXERCISE)) is None:
+            msg = "An exercise is required to query sets"
+            raise ServiceValidationError(msg)
+        if (
+            result := query_sets(coordinator, exercise, start, end, offset, limit)
+        ) is None:
+            msg = f"No workout has the exercise {exercise}"
+            raise ServiceValidationError(msg)
+        return result
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_QUERY_WORKOUTS,
+        _async_query_workouts,
+        schema=QUERY_WORKOUTS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+def _loaded_entry(hass: HomeAssistant, entry_id: str | None) -> HevyConfigEntry:
+    """Return a loaded entry, the only one if no id is given."""
+    if entry_id is None:
+        entries = [
+            entry
+            for entry in hass.config_entries.async_entries(DOMAIN)
+            if entry.state is ConfigEntryState.LOADED
+        ]
+        if len(entries) != 1:
+            msg = "A config_entry_id is required unless one Hevy account is loaded"
+            raise ServiceValidationError(msg)
+        return entries[0]
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if entry is None or entry.domain != DOMAIN:
+        msg = f"{entry_id} is not a Hevy config entry"
+        raise ServiceValidationError(msg)
+    if entry.state is not ConfigEntryState.LOADED:
+        msg = f"The Hevy config entry {entry.title} is not loaded"
+        raise ServiceValidationError(msg)
+    return entry
+
+
+def _aware(value: datetime | None) -> datetime | None:
+    """Return a datetime in the local time zone if it was given without one."""
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=dt_util.get_default_time_zone())
+
+
+def _set_as_dict(exercise_set: ExerciseSet) -> dict[str, Any]:
+    """Return a set as a service response item."""
+    return {
+        "index": exercise_set.index,
+        "type": exercise_set.set_type,
+        "weight_kg": exercise_set.weight_kg,
+        "reps": exercise_set.reps,
+        "rpe": exercise_set.rpe,
+        "duration_seconds": exercise_set.duration_seconds,
+        "distance_meters": exercise_set.distance_meters,
+    }
@@ -0,0 +1,238 @@
+"""Columnar table of every set in the workout history for hevy."""
+
+from __future__ import annotations
+
+import math
+from array import array
+from bisect import bisect_left
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from .models import Workout
+
+# Stored for reps and durations the API left out, NaN is used for the floats
+MISSING = -1
+
+# Column names and the array type codes they are stored with
+_COLUMNS = (
+    ("start_time", "d"),  # workout start, timestamp
+    ("workout", "I"),  # code in SetTable.workout_ids
+    ("exercise", "I"),  # code in SetTable.exercise_keys
+    ("set_index", "H"),
+    ("set_type", "B"),  # code in SetTable.set_types
+    ("weight_kg", "d"),
+    ("reps", "l"),
+    ("rpe", "f"),
+    ("duration_seconds", "l"),
+    ("distance_meters", "d"),
+)
+
+
+class SetColumns(NamedTuple):
+    """Typed arrays of the sets in a time range, one per column."""
+
+    start_time: array[float]
+    workout: array[int]
+    exercise: array[int]
+    set_index: array[int]
+    set_type: array[int]
+    weight_kg: array[float]
+    reps: array[int]
+    rpe: array[float]
+    duration_seconds: array[int]
+    distance_meters: array[float]
+
+
+class _Codes:
+    """Small integer codes for strings repeated across rows."""
+
+    def __init__(self) -> None:
+        """Initialize the codes."""
+        self.values: list[str] = []
+        self._codes: dict[str, int] = {}
+
+    def code(self, value: str) -> int:
+        """Return the code of a value, assigning the next one if it is new."""
+        if (code := self._codes.get(value)) is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class SetTable:
+    """
+    Every set of the indexed workouts as typed arrays, ordered by start time.
+
+    New workouts are appended. Backfilled workouts that break the order, and
+    the rows of removed or replaced workouts, are sorted in or dropped in one
+    pass on the next read, so a range read is a binary search and a copy of
+    contiguous memory. Workout ids, exercise templates and set types are
+    stored as codes into the lists on the table; once compacted, workout
+    codes follow the start time order as well.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty table."""
+        self._columns = {name: array(type_code) for name, type_code in _COLUMNS}
+        self._workout_ids: list[str] = []
+        self._workout_times = array("d")
+        self._exercises = _Codes()
+        self._exercise_titles: list[str] = []
+        self._set_types = _Codes()
+        # Codes of the indexed workouts, with the start time, first row and row
+        # count of each
+        self._workout_codes: dict[str, int] = {}
+        self._workout_rows: dict[int, tuple[float, int, int]] = {}
+        self._dead_rows = 0
+        self._sorted = True
+        # Bumped on every change, so readers can tell the rows are unchanged
+        self._revision = 0
+
+    def __len__(self) -> int:
+        """Return the number of live rows."""
+        return len(self._columns["start_time"]) - self._dead_rows
+
+    @property
+    def workout_ids(self) -> list[str]:
+        """Return the workout ids the workout column codes point to."""
+        return self._workout_ids
+
+    @property
+    def exercise_keys(self) -> list[str]:
+        """Return the exercise templates the exercise column codes point to."""
+        return self._exercises.values
+
+    @property
+    def exercise_titles(self) -> list[str]:
+        """Return the exercise titles, in exercise code order."""
+        return self._exercise_titles
+
+    @property
+    def set_types(self) -> list[str]:
+        """Return the set types the set type column codes point to."""
+        return self._set_types.values
+
+    @property
+    def revision(self) -> int:
+        """Return a number that changes whenever a workout is added or removed."""
+        return self._revision
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory taken by the column arrays."""
+        return sum(column.itemsize * len(column) for column in self._columns.values())
+
+    def add(self, workout: Workout) -> None:
+        """Append the sets of a workout, replacing it if it was added before."""
+        self.remove(workout.id)
+        self._revision += 1
+        # Every add gets a new code, so the rows of a replaced workout can be
+        # told apart until they are dropped
+        workout_code = self._workout_codes[workout.id] = len(self._workout_ids)
+        start_time = workout.start_time.timestamp()
+        if self._workout_times and start_time < self._workout_times[-1]:
+            self._sorted = False
+        self._workout_ids.append(workout.id)
+        self._workout_times.append(start_time)
+
+        columns = self._columns
+        times = columns["start_time"]
+        first_row = len(times)
+        for exercise in workout.exercises:
+            exercise_code = self._exercises.code(exercise.template_id or exercise.title)
+            if exercise_code == len(self._exercise_titles):
+                self._exercise_titles.append(exercise.title)
+            for exercise_set in exercise.sets:
+                times.append(start_time)
+                columns["workout"].append(workout_code)
+                columns["exercise"].append(exercise_code)
+                columns["set_index"].append(exercise_set.index)
+                columns["set_type"].append(self._set_types.code(exercise_set.set_type))
+                columns["weight_kg"].append(_float(exercise_set.weight_kg))
+                columns["reps"].append(_int(exercise_set.reps))
+                columns["rpe"].append(_float(exercise_set.rpe))
+                columns["duration_seconds"].append(_int(exercise_set.duration_seconds))
+                columns["distance_meters"].append(_float(exercise_set.distance_meters))
+        self._workout_rows[workout_code] = (
+            start_time,
+            first_row,
+            len(times) - first_row,
+        )
+
+    def remove(self, workout_id: str) -> None:
+        """Drop the sets of a workout on the next read."""
+        if (workout_code := self._workout_codes.pop(workout_id, None)) is None:
+            return
+        self._revision += 1
+        self._dead_rows += self._workout_rows.pop(workout_code)[2]
+
+    def columns(
+        self, start: datetime | None = None, end: datetime | None = None
+    ) -> SetColumns:
+        """Return the sets of workouts started from ``start`` until ``end``."""
+        self._compact()
+        low, high = _bounds(self._columns["start_time"], start, end)
+        return SetColumns(*(self._columns[name][low:high] for name, _ in _COLUMNS))
+
+    def workouts(
+        self, start: datetime | None = None, end: datetime | None = None
+    ) -> tuple[list[str], array[float]]:
+        """Return the ids and start times of workouts from ``start`` until ``end``."""
+        self._compact()
+        low, high = _bounds(self._workout_times, start, end)
+        return self._workout_ids[low:high], self._workout_times[low:high]
+
+    def _compact(self) -> None:
+        """Sort the rows by start time and drop the rows of removed workouts."""
+        if self._sorted and len(self._workout_ids) == len(self._workout_rows):
+            return
+        # The rows of a workout are contiguous, so whole workouts are moved
+        columns = self._columns
+        order = sorted(self._workout_rows.items(), key=lambda item: item[1][0])
+
+        self._columns = {name: array(type_code) for name, type_code in _COLUMNS}
+        workout_ids = self._workout_ids
+        self._workout_ids = []
+        self._workout_times = array("d")
+        self._workout_codes = {}
+        self._workout_rows = {}
+        for code, (start_time, first_row, rows) in order:
+            workout_code = len(self._workout_ids)
+            workout_id = workout_ids[code]
+            self._workout_ids.append(workout_id)
+            self._workout_times.append(start_time)
+            self._workout_codes[workout_id] = workout_code
+            self._workout_rows[workout_code] = (
+                start_time,
+                len(self._columns["workout"]),
+                rows,
+            )
+            for name, column in self._columns.items():
+                if name == "workout":
+                    column.extend([workout_code] * rows)
+                else:
+                    column.extend(columns[name][first_row : first_row + rows])
+        self._dead_rows = 0
+        self._sorted = True
+
+
+def _bounds(
+    times: array[float], start: datetime | None, end: datetime | None
+) -> tuple[int, int]:
+    """Return the index range of the sorted times from ``start`` until ``end``."""
+    low = 0 if start is None else bisect_left(times, start.timestamp())
+    high = len(times) if end is None else bisect_left(times, end.timestamp())
+    return low, max(low, high)
+
+
+def _float(value: float | None) -> float:
+    """Return a float column value, NaN when it is missing."""
+    return math.nan if value is None else value
+
+
+def _int(value: float | None) -> int:
+    """Return an integer column value, MISSING when it is missing."""
+    # The API may send whole numbers as floats, like 10.0, which arrays refuse
+    return MISSING if value is None else int(value)
@@ -0,0 +1,288 @@
+"""Long-term statistics import for hevy."""
+
+from __future__ import annotations
+
+import zlib
+from dataclasses import dataclass, field
+from datetime import date
+from itertools import accumulate
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    valid_statistic_id,
+)
+from homeassistant.const import UnitOfMass
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util import dt as dt_util
+from homeassistant.util import slugify
+
+from .const import DOMAIN, LOGGER, STATISTICS_BATCH_SIZE
+from .training_load import workout_volume
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.core import HomeAssistant
+
+    from .models import Workout
+    from .store import HevyWorkoutStore
+
+# Daily totals imported as statistics with a sum, with their unit
+DAILY_TOTALS = {
+    "volume": UnitOfMass.KILOGRAMS,
+    "sets": None,
+    "reps": None,
+}
+
+
+@dataclass(slots=True)
+class DayTotals:
+    """Training totals of one local day."""
+
+    volume: float = 0.0
+    sets: int = 0
+    reps: int = 0
+    # Heaviest weight per exercise, keyed by exercise template
+    max_weight_kg: dict[str, tuple[str, float]] = field(default_factory=dict)
+
+    def add(self, workout: Workout) -> None:
+        """Add a workout to the totals."""
+        # Weight times reps of the sets, like the volume sensors
+        self.volume += workout_volume(workout)
+        for exercise in workout.exercises:
+            self.sets += len(exercise.sets)
+            self.reps += exercise.total_reps
+            if exercise.max_weight_kg <= 0:
+                continue
+            key = exercise.template_id or exercise.title
+            _, heaviest = self.max_weight_kg.get(key, (None, 0.0))
+            if exercise.max_weight_kg > heaviest:
+                self.max_weight_kg[key] = (exercise.title, exercise.max_weight_kg)
+
+    def fingerprint(self) -> int:
+        """Return a fingerprint that is stable across restarts."""
+        # Round the volume, its float sum depends on the order workouts are added
+        return zlib.crc32(
+            json_bytes(
+                [
+                    round(self.volume, 3),
+                    self.sets,
+                    self.reps,
+                    sorted(self.max_weight_kg.items()),
+                ]
+            )
+        )
+
+
+class HevyStatistics:
+    """
+    Import daily training totals as external long-term statistics.
+
+    Workouts are indexed by local day as they are added and removed. On
+    import, only days whose totals changed since the last import are sent to
+    the recorder, together with the later days whose running sums moved.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, name: str) -> None:
+        """Initialize the statistics."""
+        self._hass = hass
+        self._prefix = f"{DOMAIN}:{slugify(entry_id)}"
+        self._name = name
+        self._workout_days: dict[str, date] = {}
+        self._day_workouts: dict[date, dict[str, Workout]] = {}
+        self._totals: dict[date, DayTotals] = {}
+        self._dirty: set[date] = set()
+        # Whether the last import left changed days behind
+        self._pending = False
+
+    def add(self, workout: Workout) -> None:
+        """Add a workout, replacing it if it was indexed before."""
+        self.remove(workout.id)
+        day = dt_util.as_local(workout.start_time).date()
+        self._workout_days[workout.id] = day
+        self._day_workouts.setdefault(day, {})[workout.id] = workout
+        self._dirty.add(day)
+
+    def remove(self, workout_id: str) -> None:
+        """Remove a workout from the index."""
+        if (day := self._workout_days.pop(workout_id, None)) is None:
+            return
+        workouts = self._day_workouts[day]
+        del workouts[workout_id]
+        if not workouts:
+            del self._day_workouts[day]
+        self._dirty.add(day)
+
+    @callback
+    def async_import(self, store: HevyWorkoutStore) -> None:
+        """Import the days that changed since the last import."""
+        if not self._dirty and not self._pending:
+            return
+        for day in self._dirty:
+            if workouts := self._day_workouts.get(day):
+                totals = self._totals[day] = DayTotals()
+                for workout in workouts.values():
+                    totals.add(workout)
+            else:
+                self._totals.pop(day, None)
+        self._dirty.clear()
+        self._pending = False
+
+        # Fingerprint and exercises of each imported day
+        imported = store.statistics
+        current = {
+            day.isoformat(): [totals.fingerprint(), sorted(totals.max_weight_kg)]
+            for day, totals in self._totals.items()
+        }
+        changed = {
+            day
+            for day in current.keys() | imported.keys()
+            if current.get(day) != imported.get(day)
+        }
+        if not changed:
+            return
+        if "recorder" not in self._hass.config.components:
+            # Nothing to import into, the days stay changed until there is
+            LOGGER.debug("Recorder is not loaded, not importing statistics")
+            self._pending = True
+            return
+
+        # Running sums move for every day after the first changed one, and
+        # days that lost all their workouts are reset to zero
+        cutoff = min(changed)
+        days = sorted(
+            {day.isoformat() for day in self._totals} | changed,
+        )
+        totals = [
+            self._totals.get(date.fromisoformat(day), DayTotals()) for day in days
+        ]
+        starts = {day: _day_start(day) for day in days if day >= cutoff}
+        failed: set[str] = set()
+        for key, unit in DAILY_TOTALS.items():
+            values = [getattr(day_totals, key) for day_totals in totals]
+            if not self._async_add(
+                f"{self._prefix}_{key}",
+                f"{self._name} daily {key}",
+                unit,
+                [
+                    StatisticData(start=starts[day], state=value, sum=total)
+                    for day, value, total in zip(
+                        days, values, accumulate(values), strict=True
+                    )
+                    if day >= cutoff
+                ],
+                has_sum=True,
+            ):
+                failed |= changed
+
+        failed |= self._async_add_max_weights(imported, current, changed, days, totals)
+
+        LOGGER.debug(
+            "Imported statistics of %s changed days from %s", len(changed), cutoff
+        )
+        # Days that could not be queued are imported again on the next update,
+        # queued ones are retried by the recorder until they are written
+        for day in failed:
+            if day in imported:
+                current[day] = imported[day]
+            else:
+                current.pop(day, None)
+        self._pending = bool(failed)
+        store.statistics = current
+        store.async_schedule_save()
+
+    @callback
+    def _async_add_max_weights(
+        self,
+        imported: dict[str, Any],
+        current: dict[str, Any],
+        changed: set[str],
+        days: list[str],
+        totals: list[DayTotals],
+    ) -> set[str]:
+        """Queue the max weights of the changed days, returning the refused days."""
+        # A max weight row stays in the recorder after its exercise left the
+        # day, so those exercises are cleared and imported again in full. Days
+        # imported before their exercises were stored hold only a fingerprint
+        cleared: dict[str, list[str]] = {}
+        for day in changed:
+            if not isinstance(previous := imported.get(day), list):
+                continue
+            for key in set(previous[1]).difference(current.get(day, (None, ()))[1]):
+                cleared.setdefault(key, []).append(day)
+        if cleared:
+            get_instance(self._hass).async_clear_statistics(
+                [self._max_weight_id(key) for key in cleared]
+            )
+
+        max_weights: dict[str, tuple[str, list[str], list[StatisticData]]] = {}
+        for day, day_totals in zip(days, totals, strict=True):
+            for key, (title, weight) in day_totals.max_weight_kg.items():
+                if day not in changed and key not in cleared:
+                    continue
+                _, key_days, rows = max_weights.setdefault(key, (title, [], []))
+                key_days.append(day)
+                rows.append(
+                    StatisticData(
+                        start=_day_start(day), mean=weight, min=weight, max=weight
+                    )
+                )
+        failed: set[str] = set()
+        for key, (title, key_days, rows) in max_weights.items():
+            if not self._async_add(
+                self._max_weight_id(key),
+                f"{self._name} {title} max weight",
+                UnitOfMass.KILOGRAMS,
+                rows,
+                has_sum=False,
+            ):
+                failed.update(key_days)
+                failed.update(cleared.get(key, ()))
+        return failed
+
+    def _max_weight_id(self, key: str) -> str:
+        """Return the statistic id of the daily max weight of an exercise."""
+        statistic_id = f"{self._prefix}_{slugify(key)}_max_weight"
+        if valid_statistic_id(statistic_id):
+            return statistic_id
+        # Titles without a usable slug, like one of only symbols
+        return f"{self._prefix}_{zlib.crc32(key.encode()):08x}_max_weight"
+
+    @callback
+    def _async_add(
+        self,
+        statistic_id: str,
+        name: str,
+        unit: str | None,
+        rows: list[StatisticData],
+        *,
+        has_sum: bool,
+    ) -> bool:
+        """Queue rows of one statistic for import in batches, False if refused."""
+        metadata = StatisticMetaData(
+            has_mean=not has_sum,
+            has_sum=has_sum,
+            name=name,
+            source=DOMAIN,
+            statistic_id=statistic_id,
+            unit_of_measurement=unit,
+        )
+        try:
+            for offset in range(0, len(rows), STATISTICS_BATCH_SIZE):
+                async_add_external_statistics(
+                    self._hass, metadata, rows[offset : offset + STATISTICS_BATCH_SIZE]
+                )
+        except HomeAssistantError as exception:
+            LOGGER.warning("Could not import statistic %s: %s", statistic_id, exception)
+            return False
+        return True
+
+
+def _day_start(day: str) -> datetime:
+    """Return the start of a local day given in ISO format."""
+    return dt_util.start_of_local_day(date.fromisoformat(day))
@@ -0,0 +1,120 @@
+"""Persistent workout store for hevy."""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, STORAGE_SAVE_DELAY, STORAGE_VERSION
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+class HevyWorkoutStore:
+    """Raw Hevy workouts persisted to disk, keyed by workout id."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the workout store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.workouts"
+        )
+        self.workout_count: int | None = None
+        # When the workouts were last fetched, timestamp
+        self.fetched_at: float | None = None
+        self.workouts: dict[str, dict[str, Any]] = {}
+        # Start time ranges, oldest first, in which the store held exactly the
+        # upstream workouts when they were fetched. Unbounded ends are infinite,
+        # a range reaching the newest workouts is kept current by the updates
+        self.covered: list[list[float]] = []
+        # Fingerprint and exercises of the daily totals last imported as statistics
+        self.statistics: dict[str, list[Any]] = {}
+        # Personal records per exercise, with the newest workout they include
+        self.records: dict[str, Any] = {}
+
+    async def async_load(self) -> None:
+        """Load stored workouts from disk."""
+        if (data := await self._store.async_load()) is None:
+            return
+        self.workout_count = data.get("workout_count")
+        self.fetched_at = data.get("fetched_at")
+        self.workouts = data.get("workouts", {})
+        self.covered = [
+            [-math.inf if start is None else start, math.inf if end is None else end]
+            for start, end in data.get("covered", [])
+        ]
+        self.statistics = data.get("statistics", {})
+        self.records = data.get("records", {})
+
+    async def async_remove(self) -> None:
+        """Remove the stored workouts from disk."""
+        await self._store.async_remove()
+
+    async def async_save(self) -> None:
+        """Write the store to disk now."""
+        await self._store.async_save(self._data_to_save())
+
+    def async_schedule_save(self) -> None:
+        """Schedule writing the store to disk."""
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to persist."""
+        return {
+            "workout_count": self.workout_count,
+            "fetched_at": self.fetched_at,
+            "workouts": self.workouts,
+            # JSON has no infinity, unbounded ends are saved as null
+            "covered": [
+                [None if math.isinf(start) else start, None if math.isinf(end) else end]
+                for start, end in self.covered
+            ],
+            "statistics": self.statistics,
+            "records": self.records,
+        }
+
+    def merge(self, workouts: list[dict[str, Any]]) -> list[str]:
+        """Merge workouts into the store and return the ids that were new."""
+        new_ids = [
+            workout["id"] for workout in workouts if workout["id"] not in self.workouts
+        ]
+        self.workouts.update((workout["id"], workout) for workout in workouts)
+        return new_ids
+
+    def replace_window(self, workouts: list[dict[str, Any]], *, complete: bool) -> None:
+        """
+        Replace the newest stored workouts with a freshly fetched window.
+
+        Stored workouts that started inside the window but are missing from it
+        were deleted upstream. When ``complete`` is set the window holds the
+        whole history, so everything missing from it is dropped.
+        """
+        if complete or not workouts:
+            start = -math.inf
+        else:
+            start = min(workout["start_time"] for workout in workouts)
+        self.merge(workouts)
+        self.mark_fetched({workout["id"] for workout in workouts}, start, math.inf)
+
+    def mark_fetched(self, workout_ids: set[str], start: float, end: float) -> None:
+        """
+        Record that a page held exactly ``workout_ids`` from ``start`` to ``end``.
+
+        Stored workouts that started strictly inside the range but are missing
+        from the page were deleted upstream and are dropped. Workouts on the
+        bounds are kept, they may belong to the neighbouring page.
+        """
+        for workout_id, workout in list(self.workouts.items()):
+            if start < workout["start_time"] < end and workout_id not in workout_ids:
+                del self.workouts[workout_id]
+        ranges = sorted([*self.covered, [start, end]])
+        merged = [ranges[0]]
+        for range_start, range_end in ranges[1:]:
+            # Pages overlap by one workout, so adjacent pages share a bound
+            if range_start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], range_end)
+            else:
+                merged.append([range_start, range_end])
+        self.covered = merged
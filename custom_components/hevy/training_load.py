@@ -0,0 +1,139 @@
+"""Rolling training load and streaks for hevy."""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from homeassistant.util import dt as dt_util
+
+from .const import ACUTE_LOAD_DAYS, CHRONIC_LOAD_DAYS
+
+if TYPE_CHECKING:
+    from datetime import date
+
+    from .models import Workout
+
+
+def workout_volume(workout: Workout) -> float:
+    """Return the weight lifted in a workout, as weight times reps."""
+    return sum(
+        exercise_set.weight_kg * exercise_set.reps
+        for exercise in workout.exercises
+        for exercise_set in exercise.sets
+        if exercise_set.weight_kg and exercise_set.reps
+    )
+
+
+class TrainingLoad:
+    """
+    Volume and sessions over rolling day windows, and the weekly streak.
+
+    Days are kept in a ring buffer as long as the longest window, with a
+    running sum per window. Adding or removing a workout touches one slot and
+    the sums, and advancing a day expires one slot from each window, so
+    neither depends on the size of the history.
+    """
+
+    def __init__(
+        self, windows: tuple[int, ...] = (ACUTE_LOAD_DAYS, CHRONIC_LOAD_DAYS)
+    ) -> None:
+        """Initialize the training load."""
+        self._windows = windows
+        self._size = max(windows)
+        self._volume = [0.0] * self._size
+        self._sessions = [0] * self._size
+        self._volume_sums = dict.fromkeys(windows, 0.0)
+        self._session_sums = dict.fromkeys(windows, 0)
+        # Ordinal of the newest day in the buffer
+        self._today: int | None = None
+        self._workouts: dict[str, tuple[int, float]] = {}
+        # Sessions per week, Monday based, and the streak cached for a week
+        self._weeks: Counter[int] = Counter()
+        self._streak: tuple[int, int] | None = None
+
+    def add(self, workout: Workout) -> None:
+        """Add a workout, replacing it if it was added before."""
+        self.remove(workout.id)
+        day = dt_util.as_local(workout.start_time).date().toordinal()
+        volume = workout_volume(workout)
+        self._workouts[workout.id] = (day, volume)
+        self._count(day, volume, 1)
+
+    def remove(self, workout_id: str) -> None:
+        """Remove a workout."""
+        if (workout := self._workouts.pop(workout_id, None)) is None:
+            return
+        day, volume = workout
+        self._count(day, -volume, -1)
+
+    def _count(self, day: int, volume: float, sessions: int) -> None:
+        """Count a workout in or out of its day, week and windows."""
+        week = (day - 1) // 7
+        self._weeks[week] += sessions
+        if not self._weeks[week]:
+            del self._weeks[week]
+        self._streak = None
+
+        if self._today is None or day > self._today:
+            self.advance(day)
+        age = self._today - day
+        if age >= self._size:
+            return
+        slot = day % self._size
+        self._volume[slot] += volume
+        self._sessions[slot] += sessions
+        for window in self._windows:
+            if age < window:
+                self._volume_sums[window] += volume
+                self._session_sums[window] += sessions
+
+    def advance(self, day: int) -> None:
+        """Move the newest day of the windows forward, expiring the oldest days."""
+        if self._today is None or day - self._today >= self._size:
+            self._volume = [0.0] * self._size
+            self._sessions = [0] * self._size
+            self._volume_sums = dict.fromkeys(self._windows, 0.0)
+            self._session_sums = dict.fromkeys(self._windows, 0)
+            self._today = day
+            return
+        while self._today < day:
+            self._today += 1
+            for window in self._windows:
+                # The day leaving the window, for the longest window the slot
+                # the new day reuses
+                slot = (self._today - window) % self._size
+                self._volume_sums[window] -= self._volume[slot]
+                self._session_sums[window] -= self._sessions[slot]
+            slot = self._today % self._size
+            self._volume[slot] = 0.0
+            self._sessions[slot] = 0
+
+    def week_streak(self, today: date) -> int:
+        """Return the weeks in a row with a workout, up to this week."""
+        week = (today.toordinal() - 1) // 7
+        if self._streak is None or self._streak[0] != week:
+            # A streak stays alive until a week without a workout is over
+            last = week if self._weeks[week] else week - 1
+            streak = 0
+            while self._weeks[last - streak]:
+                streak += 1
+            self._streak = (week, streak)
+        return self._streak[1]
+
+    def values(self, today: date) -> dict[str, float | int | None]:
+        """Return the rolling windows and the streak as of ``today``."""
+        self.advance(today.toordinal())
+        acute = max(self._volume_sums[ACUTE_LOAD_DAYS], 0.0)
+        chronic = max(self._volume_sums[CHRONIC_LOAD_DAYS], 0.0) * (
+            ACUTE_LOAD_DAYS / CHRONIC_LOAD_DAYS
+        )
+        return {
+            "week_tonnage": round(acute, 1),
+            "four_week_tonnage": round(
+                max(self._volume_sums[CHRONIC_LOAD_DAYS], 0.0), 1
+            ),
+            "four_week_count": self._session_sums[CHRONIC_LOAD_DAYS],
+            "acute_chronic_ratio": round(acute / chronic, 2) if chronic > 0 else None,
+            "week_streak": self.week_streak(today),
+        }
@@ -0,0 +1,354 @@
+"""Tests for the Hevy API client."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Self
+
+import aiohttp
+import pytest
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from custom_components.hevy import api
+from custom_components.hevy.api import (
+    HevyApiClient,
+    HevyApiClientCircuitOpenError,
+    HevyApiClientCommunicationError,
+    HevyApiClientError,
+    _CircuitBreaker,
+    _JsonItemStream,
+)
+
+WORKOUTS = [
+    {"id": "a", "title": "Push", "exercises": [{"sets": [{"reps": 5}]}]},
+    {"id": "b", "title": "Pull", "exercises": []},
+]
+
+
+def _feed(key: str, body: bytes, size: int) -> tuple[list[Any], _JsonItemStream]:
+    """Feed a body in chunks of ``size`` bytes and decode the items."""
+    stream = _JsonItemStream(key)
+    items = [
+        json.loads(item)
+        for start in range(0, len(body), size)
+        for item in stream.feed(body[start : start + size])
+    ]
+    return items, stream
+
+
+@pytest.mark.parametrize("size", range(1, 40))
+def test_stream_items_split_across_chunks(size: int) -> None:
+    """Items are complete whatever chunk boundaries they straddle."""
+    body = json.dumps({"page": 1, "workouts": WORKOUTS}).encode()
+
+    items, stream = _feed("workouts", body, size)
+
+    assert items == WORKOUTS
+    assert stream.complete
+
+
+def test_stream_only_yields_the_requested_array() -> None:
+    """Arrays under other keys, also nested in items, are not split out."""
+    body = json.dumps(
+        {
+            "other": [{"id": "x"}],
+            "workouts": [{"id": "a", "workouts": [{"id": "nested"}]}],
+            "after": [{"id": "y"}],
+        }
+    ).encode()
+
+    items, stream = _feed("workouts", body, 7)
+
+    assert items == [{"id": "a", "workouts": [{"id": "nested"}]}]
+    assert stream.complete
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5])
+def test_stream_escaped_quotes_and_brackets_in_strings(size: int) -> None:
+    """Quotes and brackets inside strings do not end an item."""
+    workouts = [
+        {"id": "a", "title": 'Legs "[{" day }]', "notes": "back\\slash\\"},
+        {"id": "b", "title": "]}{[", "notes": '\\"'},
+    ]
+    body = json.dumps({"workouts": workouts}).encode()
+
+    items, stream = _feed("workouts", body, size)
+
+    assert items == workouts
+    assert stream.complete
+
+
+@pytest.mark.parametrize("size", [1, 2, 3])
+def test_stream_multi_byte_utf8_split_between_chunks(size: int) -> None:
+    """Characters split between chunks decode once the item is complete."""
+    workouts = [{"id": "a", "title": "Bankdrücken 💪 ベンチ"}]
+    body = json.dumps({"workouts": workouts}, ensure_ascii=False).encode()
+
+    items, stream = _feed("workouts", body, size)
+
+    assert items == workouts
+    assert stream.complete
+
+
+def test_stream_truncated_body_is_incomplete() -> None:
+    """A body cut off mid-item yields the finished items only."""
+    body = json.dumps({"workouts": WORKOUTS}).encode()
+
+    items, stream = _feed("workouts", body[:-20], 4)
+
+    assert items == WORKOUTS[:1]
+    assert not stream.complete
+
+
+class FakeContent:
+    """Response body handing out fixed chunks."""
+
+    def __init__(self, chunks: list[bytes]) -> None:
+        """Initialize the body."""
+        self._chunks = list(chunks)
+
+    async def readany(self) -> bytes:
+        """Return the next chunk, or nothing at the end."""
+        return self._chunks.pop(0) if self._chunks else b""
+
+
+class FakeResponse:
+    """Just enough of an aiohttp response for the client."""
+
+    def __init__(
+        self,
+        status: int = 200,
+        body: bytes = b"",
+        headers: dict[str, str] | None = None,
+        chunk_size: int = 16,
+    ) -> None:
+        """Initialize the response."""
+        self.status = status
+        self.headers = CIMultiDictProxy(CIMultiDict(headers or {}))
+        self._body = body
+        self.content = FakeContent(
+            [
+                body[start : start + chunk_size]
+                for start in range(0, len(body), chunk_size)
+            ]
+        )
+
+    async def __aenter__(self) -> Self:
+        """Enter the response context."""
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Leave the response context."""
+
+    async def read(self) -> bytes:
+        """Return the whole body."""
+        return self._body
+
+    def raise_for_status(self) -> None:
+        """Raise for error statuses like aiohttp does."""
+        if self.status >= 400:
+            url = URL("https://api.hevyapp.com")
+            raise aiohttp.ClientResponseError(
+                aiohttp.RequestInfo(url, "GET", self.headers, url),
+                (),
+                status=self.status,
+                headers=self.headers,
+            )
+
+
+class FakeSession:
+    """Session answering requests with queued responses."""
+
+    def __init__(self, *responses: FakeResponse) -> None:
+        """Initialize the session."""
+        self.responses = list(responses)
+        self.requests: list[dict[str, Any]] = []
+
+    async def request(self, **kwargs: Any) -> FakeResponse:
+        """Record the request and return the next response."""
+        self.requests.append(kwargs)
+        return self.responses.pop(0)
+
+
+def _client(session: FakeSession) -> HevyApiClient:
+    """Return a client that does not retry."""
+    return HevyApiClient("token", "user", session, max_retries=0)
+
+
+async def _collect(client: HevyApiClient) -> list[dict[str, Any]]:
+    """Stream a page of workouts into a list."""
+    return [workout async for workout in client.async_iter_workouts(limit=2)]
+
+
+@pytest.mark.asyncio
+async def test_iter_workouts_streams_items() -> None:
+    """A streamed page yields every workout."""
+    body = json.dumps({"workouts": WORKOUTS}).encode()
+    client = _client(FakeSession(FakeResponse(body=body, chunk_size=3)))
+
+    assert await _collect(client) == WORKOUTS
+
+
+@pytest.mark.asyncio
+async def test_iter_workouts_truncated_body_raises() -> None:
+    """A body that ends early raises a communication error."""
+    body = json.dumps({"workouts": WORKOUTS}).encode()
+    client = _client(FakeSession(FakeResponse(body=body[:-10])))
+
+    with pytest.raises(HevyApiClientCommunicationError, match="Truncated"):
+        await _collect(client)
+
+
+@pytest.mark.asyncio
+async def test_iter_workouts_malformed_item_raises() -> None:
+    """An item that is not valid JSON raises a client error."""
+    body = b'{"workouts": [{"id": "a", "title": }]}'
+    client = _client(FakeSession(FakeResponse(body=body)))
+
+    with pytest.raises(HevyApiClientError):
+        await _collect(client)
+
+
+@pytest.mark.asyncio
+async def test_not_modified_answered_from_cache() -> None:
+    """A 304 revalidation returns the cached body without decoding it again."""
+    body = json.dumps({"workouts": WORKOUTS}).encode()
+    session = FakeSession(
+        FakeResponse(body=body, headers={"ETag": '"v1"'}),
+        FakeResponse(status=304),
+    )
+    client = _client(session)
+
+    first = await client.async_get_workouts()
+    second = await client.async_get_workouts()
+
+    assert second is first
+    assert "If-None-Match" not in session.requests[0]["headers"]
+    assert session.requests[1]["headers"]["If-None-Match"] == '"v1"'
+    assert client.cache_stats["hits"] == 1
+    assert client.cache_stats["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_response_without_validators_is_not_cached() -> None:
+    """Without an ETag or Last-Modified header nothing is revalidated."""
+    body = json.dumps({"workout_count": 3}).encode()
+    session = FakeSession(FakeResponse(body=body), FakeResponse(body=body))
+    client = _client(session)
+
+    await client.async_get_workout_count()
+    await client.async_get_workout_count()
+
+    assert "If-None-Match" not in session.requests[1]["headers"]
+    assert client.cache_stats["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_after_server_errors() -> None:
+    """Repeated server errors open the circuit and later requests fail fast."""
+    session = FakeSession(
+        *(FakeResponse(status=500) for _ in range(api.CIRCUIT_FAILURE_THRESHOLD))
+    )
+    client = _client(session)
+
+    for _ in range(api.CIRCUIT_FAILURE_THRESHOLD):
+        with pytest.raises(HevyApiClientCommunicationError):
+            await client.async_get_workout_count()
+
+    assert client.circuit_state == "open"
+    with pytest.raises(HevyApiClientCircuitOpenError):
+        await client.async_get_workout_count()
+    assert len(session.requests) == api.CIRCUIT_FAILURE_THRESHOLD
+
+
+@pytest.mark.asyncio
+async def test_client_errors_do_not_open_the_circuit() -> None:
+    """Answers like a 404 show the API is reachable."""
+    session = FakeSession(
+        *(FakeResponse(status=404) for _ in range(api.CIRCUIT_FAILURE_THRESHOLD))
+    )
+    client = _client(session)
+
+    for _ in range(api.CIRCUIT_FAILURE_THRESHOLD):
+        with pytest.raises(HevyApiClientCommunicationError):
+            await client.async_get_workout_count()
+
+    assert client.circuit_state == "closed"
+
+
+class FakeClock:
+    """Monotonic clock moved by hand."""
+
+    def __init__(self) -> None:
+        """Initialize the clock."""
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Replace the monotonic clock of the client module."""
+    fake_clock = FakeClock()
+    monkeypatch.setattr(api.time, "monotonic", fake_clock)
+    return fake_clock
+
+
+def _open_breaker() -> _CircuitBreaker:
+    """Return a breaker opened by two failures."""
+    breaker = _CircuitBreaker(threshold=2, reset_timeout=60, max_reset_timeout=200)
+    breaker.record_failure()
+    breaker.record_failure()
+    return breaker
+
+
+def test_breaker_half_open_lets_one_probe_through(clock: FakeClock) -> None:
+    """After the reset timeout a single probe request is let through."""
+    breaker = _open_breaker()
+    assert breaker.state == "open"
+    with pytest.raises(HevyApiClientCircuitOpenError):
+        breaker.before_request()
+
+    clock.now += 60
+    assert breaker.state == "half_open"
+    breaker.before_request()
+    with pytest.raises(HevyApiClientCircuitOpenError):
+        breaker.before_request()
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    breaker.before_request()
+
+
+def test_breaker_failed_probe_backs_off(clock: FakeClock) -> None:
+    """A failed probe opens the circuit for twice as long, up to the maximum."""
+    breaker = _open_breaker()
+    clock.now += 60
+
+    breaker.before_request()
+    breaker.record_failure()
+    clock.now += 119
+    assert breaker.state == "open"
+    clock.now += 1
+    assert breaker.state == "half_open"
+
+    breaker.before_request()
+    breaker.record_failure()
+    clock.now += 199
+    assert breaker.state == "open"
+    clock.now += 1
+    assert breaker.state == "half_open"
+
+
+def test_breaker_released_probe_can_be_retried(clock: FakeClock) -> None:
+    """A probe that did not complete frees the slot for the next request."""
+    breaker = _open_breaker()
+    clock.now += 60
+
+    breaker.before_request()
+    breaker.release()
+
+    breaker.before_request()